@@ -3,6 +3,10 @@ Procedural vs Object-Oriented Programming
 Demonstrates the difference between paradigms using a cloud resource management example.
 """
 
+import sys
+from dataclasses import dataclass, field
+from fractions import Fraction
+
 
 # ============================================================================
 # PROCEDURAL APPROACH
@@ -12,81 +16,96 @@ print("=" * 70)
 print("PROCEDURAL PROGRAMMING APPROACH")
 print("=" * 70)
 
-# Global data structures
-resources = []
-total_monthly_cost = 0
+
+@dataclass(slots=True)
+class ResourceRecord:
+    """Plain data record (like a C struct) - no behaviour attached."""
+    name: str
+    cloud: str
+    cost: float
+    type: str
+    active: bool = True
+
+
+@dataclass(slots=True)
+class InventoryState:
+    """All procedural data in one record, passed explicitly to each function."""
+    resources: list = field(default_factory=list)
+    resources_by_name: dict = field(default_factory=dict)
+    total_monthly_cost: float = 0
+    summary_cache: dict = None  # Reset whenever resources change
 
 
-def create_resource(name, cloud_provider, monthly_cost, resource_type):
+def create_resource(state, name, cloud_provider, monthly_cost, resource_type):
     """Create a new cloud resource (procedural style)."""
-    resource = {
-        "name": name,
-        "cloud": cloud_provider,
-        "cost": monthly_cost,
-        "type": resource_type,
-        "active": True
-    }
-    resources.append(resource)
-    global total_monthly_cost
-    total_monthly_cost += monthly_cost
+    resource = ResourceRecord(name, cloud_provider, monthly_cost, resource_type)
+    state.resources.append(resource)
+    state.resources_by_name.setdefault(name, resource)
+    state.total_monthly_cost += monthly_cost
+    state.summary_cache = None
     return resource
 
 
-def deactivate_resource(name):
+def deactivate_resource(state, name):
     """Deactivate a resource."""
-    for resource in resources:
-        if resource["name"] == name and resource["active"]:
-            resource["active"] = False
-            global total_monthly_cost
-            total_monthly_cost -= resource["cost"]
-            return True
+    resource = state.resources_by_name.get(name)
+    if resource and resource.active:
+        resource.active = False
+        state.total_monthly_cost -= resource.cost
+        state.summary_cache = None
+        return True
     return False
 
 
-def get_resources_by_cloud(cloud_provider):
+def get_resources_by_cloud(state, cloud_provider):
     """Get all resources for a specific cloud provider."""
-    return [r for r in resources if r["cloud"] == cloud_provider and r["active"]]
+    return [r for r in state.resources if r.cloud == cloud_provider and r.active]
 
 
-def calculate_total_cost():
+def calculate_total_cost(state):
     """Calculate total monthly cost."""
-    return sum(r["cost"] for r in resources if r["active"])
+    # Kept up to date by create_resource and deactivate_resource
+    return state.total_monthly_cost
 
 
-def get_resource_summary():
+def get_resource_summary(state):
     """Get summary of all resources."""
+    if state.summary_cache is not None:
+        return state.summary_cache
     summary = {}
-    for resource in resources:
-        if resource["active"]:
-            cloud = resource["cloud"]
+    for resource in state.resources:
+        if resource.active:
+            cloud = resource.cloud
             if cloud not in summary:
                 summary[cloud] = {"count": 0, "cost": 0}
             summary[cloud]["count"] += 1
-            summary[cloud]["cost"] += resource["cost"]
+            summary[cloud]["cost"] += resource.cost
+    state.summary_cache = summary
     return summary
 
 
 # Usage
 print("\nCreating resources:")
-create_resource("atlas-aks-prod", "Azure", 500, "AKS Cluster")
-create_resource("atlas-keyvault", "Azure", 50, "Key Vault")
-create_resource("backup-s3", "AWS", 100, "S3 Bucket")
-create_resource("monitoring-vm", "Azure", 200, "Virtual Machine")
+state = InventoryState()
+create_resource(state, "atlas-aks-prod", "Azure", 500, "AKS Cluster")
+create_resource(state, "atlas-keyvault", "Azure", 50, "Key Vault")
+create_resource(state, "backup-s3", "AWS", 100, "S3 Bucket")
+create_resource(state, "monitoring-vm", "Azure", 200, "Virtual Machine")
 
-print(f"Total resources: {len(resources)}")
-print(f"Total monthly cost: €{calculate_total_cost()}")
+print(f"Total resources: {len(state.resources)}")
+print(f"Total monthly cost: €{calculate_total_cost(state)}")
 
 print("\nResources by cloud:")
 for cloud in ["Azure", "AWS"]:
-    cloud_resources = get_resources_by_cloud(cloud)
+    cloud_resources = get_resources_by_cloud(state, cloud)
     print(f"{cloud}: {len(cloud_resources)} resources")
 
 print("\nDeactivating monitoring-vm...")
-deactivate_resource("monitoring-vm")
-print(f"New total cost: €{calculate_total_cost()}")
+deactivate_resource(state, "monitoring-vm")
+print(f"New total cost: €{calculate_total_cost(state)}")
 
 print("\nResource summary:")
-for cloud, info in get_resource_summary().items():
+for cloud, info in get_resource_summary(state).items():
     print(f"{cloud}: {info['count']} resources, €{info['cost']}/month")
 
 
@@ -98,33 +117,63 @@ print("\n" + "=" * 70)
 print("OBJECT-ORIENTED PROGRAMMING APPROACH")
 print("=" * 70)
 
+_CLOUD_PROVIDERS = frozenset({"Azure", "AWS", "GCP"})
+
 
+@dataclass(slots=True, eq=False)
 class CloudResource:
-    """Represents a cloud infrastructure resource."""
+    """
+    Represents a cloud infrastructure resource.
+    
+    The name identifies the resource and is used as a lookup key by
+    ResourceManager, and __str__ is precomputed from the descriptive
+    fields, so only the active flag should change after creation.
     
-    def __init__(self, name, cloud_provider, monthly_cost, resource_type):
-        """
-        Initialize a cloud resource.
-        
-        Args:
-            name (str): Resource name
-            cloud_provider (str): Cloud platform (Azure, AWS, GCP)
-            monthly_cost (float): Monthly cost in euros
-            resource_type (str): Type of resource (VM, Storage, etc.)
-        """
-        self.name = name
-        self.cloud_provider = cloud_provider
-        self.monthly_cost = monthly_cost
-        self.resource_type = resource_type
-        self.active = True
+    Attributes:
+        name (str): Resource name
+        cloud_provider (str): Cloud platform (Azure, AWS, GCP)
+        monthly_cost (float): Monthly cost in euros
+        resource_type (str): Type of resource (VM, Storage, etc.)
+        active (bool): Whether the resource is currently in use
+    """
+    
+    # @dataclass generates __init__, __repr__ and (via slots=True) __slots__
+    name: str
+    cloud_provider: str
+    monthly_cost: float
+    resource_type: str
+    active: bool = True
+    # Set by ResourceManager.add_resource
+    _manager: "ResourceManager" = field(default=None, init=False, repr=False)
+    # Preformatted __str__ results, one per state of the active flag
+    _str_active: str = field(default="", init=False, repr=False)
+    _str_inactive: str = field(default="", init=False, repr=False)
+    
+    def __post_init__(self):
+        """Validate the provider and share one string object per category."""
+        if self.cloud_provider not in _CLOUD_PROVIDERS:
+            raise ValueError(f"Unsupported cloud provider: {self.cloud_provider}")
+        # Interned strings compare by identity in provider lookups
+        self.cloud_provider = sys.intern(self.cloud_provider)
+        self.resource_type = sys.intern(self.resource_type)
+        # Only active changes after creation, so both renderings can be built now
+        base = f"{self.name} ({self.resource_type}) on {self.cloud_provider} - €{self.monthly_cost}/month"
+        self._str_active = f"{base} [Active]"
+        self._str_inactive = f"{base} [Inactive]"
     
     def deactivate(self):
         """Deactivate this resource."""
-        self.active = False
+        if self.active:
+            self.active = False
+            if self._manager is not None:
+                self._manager._on_deactivated(self)
     
     def activate(self):
         """Activate this resource."""
-        self.active = True
+        if not self.active:
+            self.active = True
+            if self._manager is not None:
+                self._manager._on_activated(self)
     
     def get_annual_cost(self):
         """Calculate annual cost."""
@@ -132,12 +181,38 @@ class CloudResource:
     
     def __str__(self):
         """String representation."""
-        status = "Active" if self.active else "Inactive"
-        return f"{self.name} ({self.resource_type}) on {self.cloud_provider} - €{self.monthly_cost}/month [{status}]"
+        return self._str_active if self.active else self._str_inactive
+
+
+class _ExactSum:
+    """
+    Running total that can be added to and subtracted from without drift.
+    
+    Values are accumulated as exact fractions, so removing what was added
+    restores the previous total exactly; reading rounds once, to the float
+    closest to the true sum (or an int if only ints were added).
+    """
+    
+    __slots__ = ("_total", "_float_terms")
     
-    def __repr__(self):
-        """Developer representation."""
-        return f"CloudResource('{self.name}', '{self.cloud_provider}', {self.monthly_cost}, '{self.resource_type}')"
+    def __init__(self):
+        self._total = Fraction(0)
+        self._float_terms = 0
+    
+    def add(self, value):
+        """Add a value to the total."""
+        self._total += Fraction(value)
+        self._float_terms += not isinstance(value, int)
+    
+    def remove(self, value):
+        """Subtract a previously added value."""
+        self._total -= Fraction(value)
+        self._float_terms -= not isinstance(value, int)
+    
+    @property
+    def value(self):
+        """Current total, rounded once."""
+        return float(self._total) if self._float_terms else int(self._total)
 
 
 class ResourceManager:
@@ -146,10 +221,50 @@ class ResourceManager:
     def __init__(self):
         """Initialize the resource manager."""
         self.resources = []
+        self._by_name = {}  # name -> resource index for O(1) lookups
+        self._resources_by_cloud = {}  # cloud provider -> resources
+        self._position = {}  # resource -> index in self.resources
+        # Running aggregates, updated in O(1) as resources change state.
+        # Costs are exact sums, so they do not drift as resources are
+        # deactivated and reactivated.
+        self._total_cost = 0
+        self._active_cost = _ExactSum()
+        self._active_count = 0
+        self._active_by_cloud = {}  # provider -> {active resource: None}
+        self._cloud_costs = {}  # provider -> _ExactSum of active costs
     
     def add_resource(self, resource):
         """Add a resource to management."""
+        self._position[resource] = len(self.resources)
         self.resources.append(resource)
+        # Keep the first resource registered under a name, like a linear scan would
+        self._by_name.setdefault(resource.name, resource)
+        self._resources_by_cloud.setdefault(resource.cloud_provider, []).append(resource)
+        resource._manager = self
+        self._total_cost += resource.monthly_cost
+        if resource.active:
+            self._on_activated(resource)
+    
+    def _on_activated(self, resource):
+        """Add an active resource to the running aggregates."""
+        cloud = resource.cloud_provider
+        self._active_cost.add(resource.monthly_cost)
+        self._active_count += 1
+        self._active_by_cloud.setdefault(cloud, {})[resource] = None
+        self._cloud_costs.setdefault(cloud, _ExactSum()).add(resource.monthly_cost)
+    
+    def _on_deactivated(self, resource):
+        """Remove a deactivated resource from the running aggregates."""
+        cloud = resource.cloud_provider
+        self._active_cost.remove(resource.monthly_cost)
+        self._active_count -= 1
+        active = self._active_by_cloud[cloud]
+        del active[resource]
+        if active:
+            self._cloud_costs[cloud].remove(resource.monthly_cost)
+        else:
+            del self._active_by_cloud[cloud]
+            del self._cloud_costs[cloud]
     
     def create_resource(self, name, cloud_provider, monthly_cost, resource_type):
         """Create and add a new resource."""
@@ -159,10 +274,7 @@ class ResourceManager:
     
     def get_resource(self, name):
         """Get a resource by name."""
-        for resource in self.resources:
-            if resource.name == name:
-                return resource
-        return None
+        return self._by_name.get(name)
     
     def deactivate_resource(self, name):
         """Deactivate a resource by name."""
@@ -172,33 +284,47 @@ class ResourceManager:
             return True
         return False
     
+    def activate_resource(self, name):
+        """Activate a resource by name."""
+        resource = self.get_resource(name)
+        if resource:
+            resource.activate()
+            return True
+        return False
+    
     def get_resources_by_cloud(self, cloud_provider):
         """Get all active resources for a cloud provider."""
-        return [r for r in self.resources if r.cloud_provider == cloud_provider and r.active]
+        return [r for r in self._resources_by_cloud.get(cloud_provider, ()) if r.active]
     
     def get_total_cost(self, active_only=True):
         """Calculate total monthly cost."""
         if active_only:
-            return sum(r.monthly_cost for r in self.resources if r.active)
-        return sum(r.monthly_cost for r in self.resources)
+            return self._active_cost.value
+        return self._total_cost
     
     def get_summary(self):
         """Get resource summary by cloud provider."""
-        summary = {}
-        for resource in self.resources:
-            if resource.active:
-                cloud = resource.cloud_provider
-                if cloud not in summary:
-                    summary[cloud] = {"count": 0, "cost": 0, "resources": []}
-                summary[cloud]["count"] += 1
-                summary[cloud]["cost"] += resource.monthly_cost
-                summary[cloud]["resources"].append(resource.name)
-        return summary
+        # Resources in the order they were added, and providers in order of
+        # their first active resource, as a scan of self.resources would
+        # list them
+        position = self._position.__getitem__
+        ordered = sorted(
+            (sorted(active, key=position) for active in self._active_by_cloud.values()),
+            key=lambda resources: position(resources[0])
+        )
+        return {
+            resources[0].cloud_provider: {
+                "count": len(resources),
+                "cost": self._cloud_costs[resources[0].cloud_provider].value,
+                "resources": [r.name for r in resources],
+            }
+            for resources in ordered
+        }
     
     def get_resource_count(self, active_only=True):
         """Get count of resources."""
         if active_only:
-            return sum(1 for r in self.resources if r.active)
+            return self._active_count
         return len(self.resources)
     
     def list_all_resources(self):
@@ -228,14 +354,14 @@ manager.deactivate_resource("monitoring-vm")
 print(f"New total cost: €{manager.get_total_cost()}")
 
 print("\nResource summary:")
+summary_lines = []
 for cloud, info in manager.get_summary().items():
-    print(f"{cloud}: {info['count']} resources, €{info['cost']}/month")
-    for resource_name in info['resources']:
-        print(f"  - {resource_name}")
+    summary_lines.append(f"{cloud}: {info['count']} resources, €{info['cost']}/month")
+    summary_lines.extend(f"  - {resource_name}" for resource_name in info['resources'])
+sys.stdout.write("\n".join(summary_lines) + "\n")
 
 print("\nAll resources:")
-for resource in manager.list_all_resources():
-    print(f"  {resource}")
+sys.stdout.write("\n".join(f"  {resource}" for resource in manager.list_all_resources()) + "\n")
 
 
 # ============================================================================
@@ -3,6 +3,21 @@ Class vs Instance Attributes
 Demonstrates the difference between class and instance attributes.
 """
 
+import itertools
+import sys
+
+_VALID_PREFIXES = ("AZ-", "AWS-", "GCP-", "CKAD-", "CKA-")
+
+# Demo output headers, formatted once at import
+_BANNER = "=" * 70
+_SECTIONS = tuple(f"\n{title:-^70}" for title in (
+    "Instance Attributes (Unique to Each Object)",
+    "Class Attributes (Shared Across All Instances)",
+    "Static Method (No Class or Instance Data Needed)",
+    "Project Revenue Sharing Example",
+    "WARNING: Modifying Class Attributes via Instance",
+))
+
 
 class CloudEngineer:
     """Represents a cloud engineer with certifications."""
@@ -10,6 +25,7 @@ class CloudEngineer:
     # Class attributes - shared across ALL instances
     cloud_platforms = ["Azure", "AWS", "GCP"]
     total_engineers = 0
+    _id_counter = itertools.count(1)
     
     def __init__(self, name, specialty, hourly_rate):
         """
@@ -24,14 +40,24 @@ class CloudEngineer:
         self.name = name
         self.specialty = specialty
         self.hourly_rate = hourly_rate
-        self.certifications = []  # Each engineer has their own list
+        # Each engineer gets their own list, created on first certification
+        self._certifications = None
         
-        # Increment class attribute
-        CloudEngineer.total_engineers += 1
+        # The shared counter hands every engineer a distinct id; the total
+        # is simply the latest id issued (a plain write, not thread-safe)
+        self.engineer_id = next(CloudEngineer._id_counter)
+        CloudEngineer.total_engineers = self.engineer_id
+    
+    @property
+    def certifications(self):
+        """Certifications earned so far, as a tuple (use add_certification)."""
+        return tuple(self._certifications or ())
     
     def add_certification(self, cert_code):
         """Add a certification to this engineer's record."""
-        self.certifications.append(cert_code)
+        if self._certifications is None:
+            self._certifications = []
+        self._certifications.append(cert_code)
         return f"{self.name} earned certification: {cert_code}"
     
     def calculate_monthly_revenue(self, hours_per_month):
@@ -57,8 +83,18 @@ class CloudEngineer:
         Validate certification code format.
         Static method - doesn't need instance or class data.
         """
-        valid_prefixes = ["AZ-", "AWS-", "GCP-", "CKAD-", "CKA-"]
-        return any(code.startswith(prefix) for prefix in valid_prefixes)
+        # str.startswith accepts a tuple and checks every prefix in one call
+        return code.startswith(_VALID_PREFIXES)
+    
+    @staticmethod
+    def validate_cert_codes(codes):
+        """
+        Validate a batch of certification codes.
+        
+        Returns:
+            list[bool]: Validity of each code, in input order
+        """
+        return [code.startswith(_VALID_PREFIXES) for code in codes]
 
 
 class TeamRockstarsProject:
@@ -67,6 +103,7 @@ class TeamRockstarsProject:
     # Class attribute - shared revenue model
     revenue_split = {"rockstars": 0.30, "engineer": 0.70}
     active_projects = 0
+    _id_counter = itertools.count(1)
     
     def __init__(self, project_name, client_name, engineer_count):
         """
@@ -83,7 +120,8 @@ class TeamRockstarsProject:
         self.hours_logged = 0
         self.is_active = True
         
-        TeamRockstarsProject.active_projects += 1
+        self.project_id = next(TeamRockstarsProject._id_counter)
+        TeamRockstarsProject.active_projects = self.project_id
     
     def log_hours(self, hours, hourly_rate):
         """
@@ -126,15 +164,15 @@ class TeamRockstarsProject:
 def main():
     """Demonstrate class vs instance attributes."""
     
-    print("=" * 70)
+    print(_BANNER)
     print("CLASS vs INSTANCE ATTRIBUTES")
-    print("=" * 70)
+    print(_BANNER)
     
     # Create engineer instances
     willem = CloudEngineer("Willem van Heemstra", "DevSecOps", 116)
     sabine = CloudEngineer("Sabine", "Security Architecture", 120)
     
-    print(f"\n{'Instance Attributes (Unique to Each Object)':-^70}")
+    print(_SECTIONS[0])
     
     # Each instance has its own attributes
     print(f"\nWillem's specialty: {willem.specialty}")
@@ -150,7 +188,7 @@ def main():
     print(f"\nWillem's certifications: {willem.certifications}")
     print(f"Sabine's certifications: {sabine.certifications}")
     
-    print(f"\n{'Class Attributes (Shared Across All Instances)':-^70}")
+    print(_SECTIONS[1])
     
     # Class attributes are shared
     print(f"\nSupported platforms (via class): {CloudEngineer.cloud_platforms}")
@@ -172,18 +210,19 @@ def main():
     jan = CloudEngineer("Jan", "Cloud Architecture", 125)
     print(f"After creating Jan: {CloudEngineer.get_total_engineers()} engineers")
     
-    print(f"\n{'Static Method (No Class or Instance Data Needed)':-^70}")
+    print(_SECTIONS[2])
     
     # Static method doesn't need instance or class
     test_codes = ["AZ-305", "INVALID-123", "AWS-SAA", "RANDOM"]
     
     print(f"\nValidating certification codes:")
-    for code in test_codes:
-        is_valid = CloudEngineer.validate_cert_code(code)
+    lines = []
+    for code, is_valid in zip(test_codes, CloudEngineer.validate_cert_codes(test_codes)):
         status = "✓ Valid" if is_valid else "✗ Invalid"
-        print(f"  {code}: {status}")
+        lines.append(f"  {code}: {status}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    print(f"\n{'Project Revenue Sharing Example':-^70}")
+    print(_SECTIONS[3])
     
     # Create projects
     atlas = TeamRockstarsProject("Atlas IDP", "Confidential Client", 10)
@@ -210,7 +249,7 @@ def main():
     
     print(f"\nActive projects: {TeamRockstarsProject.active_projects}")
     
-    print(f"\n{'WARNING: Modifying Class Attributes via Instance':-^70}")
+    print(_SECTIONS[4])
     
     # Demonstrate dangerous pattern
     print("\nDangerous: Modifying mutable class attribute via instance")
@@ -3,13 +3,36 @@ Constructor Examples
 Demonstrates various constructor patterns and initialization techniques.
 """
 
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from operator import itemgetter
+from typing import List, Optional
+
+# Validation rules are built once at import time, not on every constructor call
+_EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+_VALID_LEVELS = frozenset(("junior", "mid", "senior"))
+_CONTRACT_FIELDS = itemgetter("full_name", "contact_email", "assigned_dept", "annual_salary")
+
+# Demo output headers, formatted once at import
+_BANNER = "=" * 70
+_SECTIONS = tuple(f"\n{title:-^70}" for title in (
+    "1. Basic Constructor",
+    "2. Default Parameters",
+    "3. Validation in Constructor",
+    "4. Complex Initialization",
+    "5. Alternative Constructors (Class Methods)",
+    "6. Type-Hinted Constructor",
+    "7. PITFALL: Mutable Default Arguments",
+))
 
 
 class BasicConstructor:
     """Simple constructor with required parameters."""
     
+    # No per-instance __dict__: attributes live in fixed slots
+    __slots__ = ("name", "age")
+    
     def __init__(self, name, age):
         """
         Basic initialization.
@@ -25,6 +48,8 @@ class BasicConstructor:
 class DefaultParameters:
     """Constructor with default parameter values."""
     
+    __slots__ = ("name", "role", "hourly_rate", "active")
+    
     def __init__(self, name, role="Engineer", hourly_rate=100, active=True):
         """
         Initialize with default values.
@@ -57,7 +82,7 @@ class ValidationConstructor:
             ValueError: If validation fails
         """
         # Email validation
-        if "@" not in email or "." not in email:
+        if not _EMAIL_RE.match(email):
             raise ValueError(f"Invalid email format: {email}")
         
         # Age validation
@@ -65,10 +90,9 @@ class ValidationConstructor:
             raise ValueError(f"Age must be between 18 and 70, got: {age}")
         
         # Level validation
-        valid_levels = ["junior", "mid", "senior"]
-        if certification_level not in valid_levels:
+        if certification_level not in _VALID_LEVELS:
             raise ValueError(
-                f"Level must be one of {valid_levels}, got: {certification_level}"
+                f"Level must be one of {sorted(_VALID_LEVELS)}, got: {certification_level}"
             )
         
         self.email = email
@@ -79,6 +103,8 @@ class ValidationConstructor:
 class ComplexInitialization:
     """Constructor that performs complex initialization."""
     
+    _MILESTONE_KEYS = ("kickoff", "design", "implementation", "testing", "deployment")
+    
     def __init__(self, project_name, start_date=None):
         """
         Initialize with computed attributes.
@@ -93,32 +119,55 @@ class ComplexInitialization:
         # Computed attributes
         self.project_id = self._generate_project_id()
         self.team_members = []
-        self.milestones = {}
         self.status = "planning"
         
-        # Initialize with default milestones
-        self._setup_default_milestones()
+        # The milestone dict is only built once it is first used
+        self._milestones = None
     
     def _generate_project_id(self):
         """Generate a unique project ID."""
-        timestamp = self.start_date.strftime("%Y%m%d")
+        d = self.start_date
         name_part = self.project_name[:4].upper()
-        return f"PRJ-{name_part}-{timestamp}"
-    
-    def _setup_default_milestones(self):
-        """Set up default project milestones."""
-        self.milestones = {
-            "kickoff": None,
-            "design": None,
-            "implementation": None,
-            "testing": None,
-            "deployment": None
-        }
+        # Same as strftime("%Y%m%d") without parsing a format string
+        return f"PRJ-{name_part}-{d.year:04d}{d.month:02d}{d.day:02d}"
+    
+    @property
+    def milestones(self):
+        """Default project milestones mapped to their dates (None if unset)."""
+        # Created on first use and kept, so edits to the dict are not lost
+        if self._milestones is None:
+            self._milestones = dict.fromkeys(self._MILESTONE_KEYS)
+        return self._milestones
+    
+    @milestones.setter
+    def milestones(self, value):
+        """Replace the milestone mapping, as with a plain attribute."""
+        self._milestones = value
+    
+    def set_milestone(self, milestone, date):
+        """
+        Record the date of a default milestone.
+        
+        Raises:
+            ValueError: If the milestone is not one of the defaults
+        """
+        if milestone not in self._MILESTONE_KEYS:
+            raise ValueError(f"Unknown milestone: {milestone}")
+        self.milestones[milestone] = date
 
 
 class AlternativeConstructors:
     """Class with multiple constructor patterns using class methods."""
     
+    _ANNUAL_HOURS = 40 * 52  # Approximate billable hours per year
+    
+    # Source kind -> name of the alternative constructor that handles it
+    _FACTORIES = {
+        "contract": "from_contract_dict",
+        "csv": "from_csv_row",
+        "cloud": "create_cloud_engineer",
+    }
+    
     def __init__(self, name, email, department, salary):
         """
         Primary constructor.
@@ -145,12 +194,8 @@ class AlternativeConstructors:
         Returns:
             AlternativeConstructors: New instance
         """
-        return cls(
-            name=contract_data["full_name"],
-            email=contract_data["contact_email"],
-            department=contract_data["assigned_dept"],
-            salary=contract_data["annual_salary"]
-        )
+        name, email, department, salary = _CONTRACT_FIELDS(contract_data)
+        return cls(name=name, email=email, department=department, salary=salary)
     
     @classmethod
     def from_csv_row(cls, csv_row):
@@ -163,12 +208,13 @@ class AlternativeConstructors:
         Returns:
             AlternativeConstructors: New instance
         """
-        parts = csv_row.split(",")
+        # Columns after the fourth are ignored
+        name, email, department, salary = (part.strip() for part in csv_row.split(",")[:4])
         return cls(
-            name=parts[0].strip(),
-            email=parts[1].strip(),
-            department=parts[2].strip(),
-            salary=float(parts[3].strip())
+            name=name,
+            email=email,
+            department=department,
+            salary=float(salary)
         )
     
     @classmethod
@@ -184,33 +230,58 @@ class AlternativeConstructors:
         Returns:
             AlternativeConstructors: Cloud engineer instance
         """
-        annual_salary = hourly_rate * 40 * 52  # Approximate annual
+        annual_salary = hourly_rate * cls._ANNUAL_HOURS
         return cls(name, email, "Cloud Engineering", annual_salary)
-
-
-class TypeHintedConstructor:
-    """Constructor with type hints for better IDE support."""
-    
-    def __init__(
-        self,
-        name: str,
-        certifications: Optional[List[str]] = None,
-        years_experience: int = 0,
-        skills: Optional[List[str]] = None
-    ) -> None:
+    
+    @classmethod
+    def create(cls, kind, *args, **kwargs):
         """
-        Initialize with type hints.
+        Dispatch to an alternative constructor by source kind.
         
         Args:
-            name: Engineer's name
-            certifications: List of certification codes
-            years_experience: Years of professional experience
-            skills: List of technical skills
+            kind (str): One of "contract", "csv" or "cloud"
+            *args, **kwargs: Passed on to the selected constructor
+            
+        Returns:
+            AlternativeConstructors: New instance
+            
+        Raises:
+            ValueError: If the kind is unknown
         """
-        self.name = name
-        self.certifications = certifications or []
-        self.years_experience = years_experience
-        self.skills = skills or []
+        try:
+            factory_name = cls._FACTORIES[kind]
+        except KeyError:
+            raise ValueError(f"Unknown source kind: {kind}") from None
+        return getattr(cls, factory_name)(*args, **kwargs)
+
+
+# eq=False keeps identity equality and hashing, as with a hand-written class
+@dataclass(eq=False, slots=True)
+class TypeHintedConstructor:
+    """
+    Constructor generated from type-hinted fields by @dataclass.
+    
+    Attributes:
+        name: Engineer's name
+        certifications: List of certification codes
+        years_experience: Years of professional experience
+        skills: List of technical skills (extend it through add_skill)
+    """
+    
+    name: str
+    certifications: Optional[List[str]] = field(default_factory=list)
+    years_experience: int = 0
+    skills: Optional[List[str]] = field(default_factory=list)
+    # Mirror of skills for O(1) duplicate checks in add_skill
+    _skill_set: set = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Replace explicit None with empty lists and index the skills."""
+        if self.certifications is None:
+            self.certifications = []
+        if self.skills is None:
+            self.skills = []
+        self._skill_set = set(self.skills)
     
     def add_certification(self, cert: str) -> None:
         """Add a certification."""
@@ -218,7 +289,8 @@ class TypeHintedConstructor:
     
     def add_skill(self, skill: str) -> None:
         """Add a technical skill."""
-        if skill not in self.skills:
+        if skill not in self._skill_set:
+            self._skill_set.add(skill)
             self.skills.append(skill)
 
 
@@ -231,26 +303,31 @@ class MutableDefaultPitfall:
         self.skills = skills  # Same list shared across instances!
 
 
+@dataclass(eq=False, slots=True)
 class MutableDefaultFixed:
     """Correct way to handle mutable defaults."""
     
-    def __init__(self, name, skills=None):
-        self.name = name
-        self.skills = skills if skills is not None else []
+    name: str
+    skills: Optional[List[str]] = field(default_factory=list)  # New list per instance
+    
+    def __post_init__(self) -> None:
+        """Treat an explicit None like the default."""
+        if self.skills is None:
+            self.skills = []
 
 
 def main():
     """Demonstrate various constructor patterns."""
     
-    print("=" * 70)
+    print(_BANNER)
     print("CONSTRUCTOR PATTERNS")
-    print("=" * 70)
+    print(_BANNER)
     
-    print(f"\n{'1. Basic Constructor':-^70}")
+    print(_SECTIONS[0])
     person = BasicConstructor("Willem", 55)
     print(f"Name: {person.name}, Age: {person.age}")
     
-    print(f"\n{'2. Default Parameters':-^70}")
+    print(_SECTIONS[1])
     emp1 = DefaultParameters("Alice")
     emp2 = DefaultParameters("Bob", "Senior Engineer", 150)
     emp3 = DefaultParameters("Carol", hourly_rate=125, active=False)
@@ -259,7 +336,7 @@ def main():
     print(f"Employee 2: {emp2.name}, {emp2.role}, €{emp2.hourly_rate}/hr")
     print(f"Employee 3: {emp3.name}, {emp3.role}, €{emp3.hourly_rate}/hr, Active: {emp3.active}")
     
-    print(f"\n{'3. Validation in Constructor':-^70}")
+    print(_SECTIONS[2])
     try:
         valid = ValidationConstructor("willem@example.com", 55, "senior")
         print(f"✓ Valid engineer created: {valid.email}")
@@ -276,14 +353,14 @@ def main():
     except ValueError as e:
         print(f"✗ Caught expected error: {e}")
     
-    print(f"\n{'4. Complex Initialization':-^70}")
+    print(_SECTIONS[3])
     project = ComplexInitialization("Atlas IDP Platform")
     print(f"Project: {project.project_name}")
     print(f"Project ID: {project.project_id}")
     print(f"Status: {project.status}")
     print(f"Milestones: {list(project.milestones.keys())}")
     
-    print(f"\n{'5. Alternative Constructors (Class Methods)':-^70}")
+    print(_SECTIONS[4])
     
     # Using primary constructor
     emp_direct = AlternativeConstructors(
@@ -317,7 +394,11 @@ def main():
     )
     print(f"Cloud Engineer: {emp_engineer.name} - €{emp_engineer.salary:,.0f}/year")
     
-    print(f"\n{'6. Type-Hinted Constructor':-^70}")
+    # Dispatching by source kind
+    emp_dispatched = AlternativeConstructors.create("csv", csv_data)
+    print(f"Via create('csv'): {emp_dispatched.name} - {emp_dispatched.department}")
+    
+    print(_SECTIONS[5])
     engineer = TypeHintedConstructor(
         name="Willem van Heemstra",
         certifications=["AZ-104", "AZ-700"],
@@ -332,7 +413,7 @@ def main():
     engineer.add_skill("Crossplane")
     print(f"After additions: {engineer.certifications}, {engineer.skills}")
     
-    print(f"\n{'7. PITFALL: Mutable Default Arguments':-^70}")
+    print(_SECTIONS[6])
     
     print("\n⚠️  WRONG WAY (Mutable default []):")
     dev1 = MutableDefaultPitfall("Developer 1")
@@ -344,7 +425,7 @@ def main():
     print(f"  dev2.skills: {dev2.skills}")  # Also has Python!
     print(f"  Same list? {dev1.skills is dev2.skills}")
     
-    print("\n✓ CORRECT WAY (None default):")
+    print("\n✓ CORRECT WAY (default_factory):")
     dev3 = MutableDefaultFixed("Developer 3")
     dev4 = MutableDefaultFixed("Developer 4")
     
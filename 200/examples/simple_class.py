@@ -3,6 +3,9 @@ Simple Class Examples
 Demonstrates basic class creation and object instantiation.
 """
 
+# Demo output separator
+_BANNER = "=" * 60
+
 
 class Dog:
     """A simple class representing a dog."""
@@ -10,6 +13,9 @@ class Dog:
     # Class attribute - shared by all instances
     species = "Canis familiaris"
     
+    # Instance attributes are stored in fixed slots instead of a __dict__
+    __slots__ = ("name", "age", "breed")
+    
     def __init__(self, name, age, breed):
         """
         Initialize a new Dog instance.
@@ -41,8 +47,10 @@ class Dog:
 class CloudProject:
     """Represents a cloud infrastructure project."""
     
-    # Class attribute
-    supported_clouds = ["Azure", "AWS", "GCP"]
+    # Class attribute (frozenset: fast membership checks, cannot be mutated)
+    supported_clouds = frozenset({"Azure", "AWS", "GCP"})
+    
+    __slots__ = ("name", "cloud_provider", "budget", "resources")
     
     def __init__(self, name, cloud_provider, budget):
         """
@@ -83,9 +91,9 @@ class CloudProject:
 def main():
     """Demonstrate basic class usage."""
     
-    print("=" * 60)
+    print(_BANNER)
     print("Dog Class Examples")
-    print("=" * 60)
+    print(_BANNER)
     
     # Create two dog instances
     beau = Dog("Beau", 5, "Dachshund")
@@ -111,9 +119,9 @@ def main():
     print(f"\n{beau.birthday()}")
     print(f"Updated description: {beau.description()}")
     
-    print("\n" + "=" * 60)
+    print("\n" + _BANNER)
     print("CloudProject Class Examples")
-    print("=" * 60)
+    print(_BANNER)
     
     # Create project instances
     atlas = CloudProject("Atlas IDP", "Azure", 150000)
@@ -137,7 +145,7 @@ def main():
         print(f"  {key.capitalize()}: {value}")
     
     # Display supported clouds
-    print(f"\nSupported cloud platforms: {', '.join(CloudProject.supported_clouds)}")
+    print(f"\nSupported cloud platforms: {', '.join(sorted(CloudProject.supported_clouds))}")
 
 
 if __name__ == "__main__":
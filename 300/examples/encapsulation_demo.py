@@ -3,6 +3,13 @@ Encapsulation Examples
 Demonstrates data hiding, properties, and access control.
 """
 
+import hashlib
+import hmac
+import math
+import os
+from random import randint
+from typing import NamedTuple
+
 
 # ============================================================================
 # Example 1: Private Attributes with Name Mangling
@@ -11,11 +18,18 @@ Demonstrates data hiding, properties, and access control.
 class BankAccount:
     """Demonstrates private attributes and controlled access."""
     
+    # Private names are mangled here too (__pin_hash -> _BankAccount__pin_hash)
+    __slots__ = ("account_holder", "_balance", "__account_number", "__pin_salt", "__pin_hash")
+    
     def __init__(self, account_holder, initial_balance=0):
         self.account_holder = account_holder  # Public
         self._balance = initial_balance       # Protected
         self.__account_number = self._generate_account_number()  # Private
-        self.__pin = None
+        # A salted digest of the PIN is kept instead of the PIN. The salt
+        # defeats a shared precomputed table, but a 4-digit PIN has only
+        # 10,000 values, so this is not real protection if the digest leaks.
+        self.__pin_salt = os.urandom(16)
+        self.__pin_hash = None
     
     def set_pin(self, pin):
         """Set PIN with validation."""
@@ -23,11 +37,21 @@ class BankAccount:
             raise ValueError("PIN must be 4 digits")
         if not pin.isdigit():
             raise ValueError("PIN must contain only digits")
-        self.__pin = pin
+        self.__pin_hash = self._hash_pin(pin, self.__pin_salt)
     
     def verify_pin(self, pin):
         """Verify PIN without exposing it."""
-        return self.__pin == pin
+        if self.__pin_hash is None or not isinstance(pin, str):
+            return False
+        # Constant-time comparison does not leak how many bytes matched
+        return hmac.compare_digest(
+            self.__pin_hash, self._hash_pin(pin, self.__pin_salt)
+        )
+    
+    @staticmethod
+    def _hash_pin(pin, salt):
+        """Protected helper: salted digest used to store and compare PINs."""
+        return hashlib.blake2b(pin.encode(), salt=salt, digest_size=16).digest()
     
     def deposit(self, amount, pin):
         """Deposit money with PIN verification."""
@@ -57,8 +81,7 @@ class BankAccount:
     
     def _generate_account_number(self):
         """Protected helper method."""
-        import random
-        return f"NL{random.randint(1000000000, 9999999999)}"
+        return f"NL{randint(1000000000, 9999999999)}"
     
     def get_account_info(self):
         """Public information without sensitive data."""
@@ -108,6 +131,9 @@ except ValueError as e:
 class Engineer:
     """Demonstrates @property decorator for controlled access."""
     
+    # Slots hold the private storage; the properties stay the public API
+    __slots__ = ("_name", "_hourly_rate", "_years_experience", "_certifications")
+    
     def __init__(self, name, hourly_rate, years_experience=0):
         self._name = name
         self._hourly_rate = hourly_rate
@@ -153,8 +179,8 @@ class Engineer:
     
     @property
     def certifications(self):
-        """Get certifications (read-only list copy)."""
-        return self._certifications.copy()
+        """Get certifications (read-only tuple snapshot)."""
+        return tuple(self._certifications)
     
     def add_certification(self, cert):
         """Add certification through method."""
@@ -219,7 +245,10 @@ except AttributeError as e:
 
 # Certifications are protected from direct modification
 certs = willem.certifications
-certs.append("FAKE-CERT")  # Modifies the copy, not original
+try:
+    certs.append("FAKE-CERT")  # Tuples have no mutating methods
+except AttributeError as e:
+    print(f"✗ Cannot modify certifications: {e}")
 print(f"Original certifications still safe: {willem.certifications}")
 
 
@@ -271,6 +300,8 @@ print(result)
 class Rectangle:
     """Demonstrates properties that depend on each other."""
     
+    __slots__ = ("_width", "_height")
+    
     def __init__(self, width, height):
         self._width = width
         self._height = height
@@ -308,8 +339,7 @@ class Rectangle:
     @property
     def diagonal(self):
         """Computed using Pythagorean theorem."""
-        import math
-        return math.sqrt(self._width ** 2 + self._height ** 2)
+        return math.hypot(self._width, self._height)
     
     @property
     def is_square(self):
@@ -350,6 +380,17 @@ print(f"Area: {rect.area}")
 # Example 5: Property with Setter Side Effects
 # ============================================================================
 
+_MISS = object()  # Sentinel: distinguishes "not cached" from a cached None
+
+
+class CacheStats(NamedTuple):
+    """Immutable snapshot of cache statistics (hit_rate in percent)."""
+    hits: int
+    misses: int
+    hit_rate: float
+    size: int
+
+
 class CacheManager:
     """Demonstrates properties with side effects."""
     
@@ -386,12 +427,12 @@ class CacheManager:
         if not self._cache_enabled:
             return None
         
-        if key in self._cache:
-            self._cache_hits += 1
-            return self._cache[key]
-        else:
+        value = self._cache.get(key, _MISS)  # One lookup for hit and miss
+        if value is _MISS:
             self._cache_misses += 1
             return None
+        self._cache_hits += 1
+        return value
     
     def set(self, key, value):
         """Set value in cache."""
@@ -402,13 +443,8 @@ class CacheManager:
     def stats(self):
         """Read-only statistics."""
         total = self._cache_hits + self._cache_misses
-        hit_rate = (self._cache_hits / total * 100) if total > 0 else 0
-        return {
-            "hits": self._cache_hits,
-            "misses": self._cache_misses,
-            "hit_rate": f"{hit_rate:.1f}%",
-            "size": len(self._cache)
-        }
+        hit_rate = (self._cache_hits / total * 100) if total > 0 else 0.0
+        return CacheStats(self._cache_hits, self._cache_misses, hit_rate, len(self._cache))
 
 
 print("\n" + "=" * 70)
@@ -428,9 +464,14 @@ print(f"Retrieved: {cache.get('user:1')}")
 print(f"Retrieved: {cache.get('user:1')}")  # Hit
 print(f"Retrieved: {cache.get('user:3')}")  # Miss
 
-print(f"\nCache stats: {cache.stats}")
+stats = cache.stats  # Formatting is left to the caller
+print(f"\nCache stats: {stats.hits} hits, {stats.misses} misses, "
+      f"{stats.hit_rate:.1f}% hit rate, {stats.size} items")
 
 # Disable cache - triggers clearing
 cache.cache_enabled = False
 
-print(f"After disabling: {cache.stats}")
+# Clearing drops the items but keeps the hit/miss counters
+stats = cache.stats
+print(f"After disabling: {stats.hits} hits, {stats.misses} misses, "
+      f"{stats.hit_rate:.1f}% hit rate, {stats.size} items")
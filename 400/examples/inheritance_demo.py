@@ -3,8 +3,13 @@ Inheritance Examples
 Demonstrates single inheritance, multiple inheritance, and MRO.
 """
 
+import itertools
+import logging
+import sys
 from abc import ABC, abstractmethod
 
+_MISSING = object()  # Sentinel for attributes that are not set at all
+
 
 # ============================================================================
 # Example 1: Single Inheritance Hierarchy
@@ -14,6 +19,10 @@ class CloudResource:
     """Base class for all cloud resources."""
     
     resource_count = 0  # Class attribute
+    _id_counter = itertools.count(1)
+    
+    # Fixed per-instance layout; each subclass adds only its own slots
+    __slots__ = ("resource_id", "name", "cloud_provider", "region", "active", "tags")
     
     def __init__(self, name, cloud_provider, region):
         self.name = name
@@ -21,7 +30,10 @@ class CloudResource:
         self.region = region
         self.active = True
         self.tags = {}
-        CloudResource.resource_count += 1
+        # Ids come from a shared counter; resource_count mirrors the latest
+        # one in a separate write, so the pair is not thread-safe
+        self.resource_id = next(CloudResource._id_counter)
+        CloudResource.resource_count = self.resource_id
     
     def activate(self):
         """Activate the resource."""
@@ -49,6 +61,8 @@ class CloudResource:
 class VirtualMachine(CloudResource):
     """Virtual Machine resource."""
     
+    __slots__ = ("cpu_cores", "memory_gb", "os", "running")
+    
     def __init__(self, name, cloud_provider, region, cpu_cores, memory_gb, os):
         super().__init__(name, cloud_provider, region)
         self.cpu_cores = cpu_cores
@@ -82,11 +96,16 @@ class VirtualMachine(CloudResource):
 class KubernetesCluster(CloudResource):
     """Kubernetes cluster resource."""
     
+    _DEFAULT_NAMESPACES = ("default", "kube-system")
+    
+    __slots__ = ("node_count", "k8s_version", "namespaces", "_namespace_set")
+    
     def __init__(self, name, cloud_provider, region, node_count, k8s_version):
         super().__init__(name, cloud_provider, region)
         self.node_count = node_count
         self.k8s_version = k8s_version
-        self.namespaces = ["default", "kube-system"]
+        self.namespaces = list(self._DEFAULT_NAMESPACES)  # Ordered, for display
+        self._namespace_set = set(self._DEFAULT_NAMESPACES)  # For membership checks
     
     def scale(self, new_node_count):
         """Scale the cluster."""
@@ -98,7 +117,8 @@ class KubernetesCluster(CloudResource):
     
     def add_namespace(self, namespace):
         """Add a namespace."""
-        if namespace not in self.namespaces:
+        if namespace not in self._namespace_set:
+            self._namespace_set.add(namespace)
             self.namespaces.append(namespace)
     
     def get_info(self):
@@ -139,9 +159,20 @@ print(f"\nTotal cloud resources created: {CloudResource.resource_count}")
 class Loggable:
     """Mixin for logging functionality."""
     
+    # Used when Loggable itself is instantiated; subclasses get their own
+    _logger = logging.getLogger("Loggable")
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # One logger per class, named after it, looked up once at class creation
+        cls._logger = logging.getLogger(cls.__name__)
+    
     def log(self, message, level="INFO"):
-        """Log a message."""
-        print(f"[{level}] {self.__class__.__name__}: {message}")
+        """Log a message at a named level (unknown names log as INFO)."""
+        levelno = logging.getLevelName(str(level).upper())
+        if not isinstance(levelno, int):
+            levelno = logging.INFO
+        self._logger.log(levelno, message)
 
 
 class Serializable:
@@ -149,6 +180,11 @@ class Serializable:
     
     def to_dict(self):
         """Convert to dictionary."""
+        # Classes can list their fields once instead of having every
+        # call filter __dict__
+        fields = getattr(self, '_serializable_fields', None)
+        if fields is not None:
+            return {k: getattr(self, k) for k in fields}
         return {
             k: v for k, v in self.__dict__.items()
             if not k.startswith('_') and not callable(v)
@@ -168,9 +204,10 @@ class Validatable:
         errors = []
         
         # Check for required attributes
-        required = getattr(self, '_required_fields', [])
+        required = getattr(self, '_required_fields', ())
         for field in required:
-            if not hasattr(self, field) or getattr(self, field) is None:
+            value = getattr(self, field, _MISSING)  # One lookup instead of hasattr + getattr
+            if value is _MISSING or value is None:
                 errors.append(f"Missing required field: {field}")
         
         return errors if errors else True
@@ -179,7 +216,8 @@ class Validatable:
 class Employee(Loggable, Serializable, Validatable):
     """Employee with multiple mixins."""
     
-    _required_fields = ['name', 'employee_id', 'email']
+    _required_fields = ('name', 'employee_id', 'email')
+    _serializable_fields = ('name', 'employee_id', 'email', 'department')
     
     def __init__(self, name, employee_id, email, department=None):
         self.name = name
@@ -198,7 +236,8 @@ class Employee(Loggable, Serializable, Validatable):
 class CloudEngineer(Employee):
     """Engineer with additional capabilities from mixins."""
     
-    _required_fields = Employee._required_fields + ['specialty']
+    _required_fields = Employee._required_fields + ('specialty',)
+    _serializable_fields = Employee._serializable_fields + ('specialty', 'certifications')
     
     def __init__(self, name, employee_id, email, specialty, certifications=None):
         super().__init__(name, employee_id, email, "Engineering")
@@ -211,6 +250,16 @@ class CloudEngineer(Employee):
         self.log(f"Added certification: {cert}", "INFO")
 
 
+# When run as a script, send mixin log records to stdout in the same
+# "[LEVEL] Class: message" layout the demo output uses. Importers keep
+# their own logging configuration.
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stdout,
+    )
+
 print("\n" + "=" * 70)
 print("Example 2: Multiple Inheritance (Mixins)")
 print("=" * 70)
@@ -42,6 +42,8 @@ print(make_it_quack(Person()))
 
 # Example 3: Operator overloading
 class Money:
+    __slots__ = ("amount",)
+    
     def __init__(self, amount):
         self.amount = amount
     
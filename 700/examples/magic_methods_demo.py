@@ -3,8 +3,13 @@ Magic Methods Examples
 Operator overloading and special methods.
 """
 
+from functools import total_ordering
+from time import perf_counter
+
 # Example 1: String representation
 class Product:
+    __slots__ = ("name", "price")
+    
     def __init__(self, name, price):
         self.name = name
         self.price = price
@@ -20,28 +25,44 @@ print(str(p))
 print(repr(p))
 
 # Example 2: Comparison operators
+@total_ordering
 class Version:
+    __slots__ = ("major", "minor")
+    
     def __init__(self, major, minor):
         self.major = major
         self.minor = minor
     
+    # @total_ordering derives <=, > and >= from these two
     def __eq__(self, other):
-        return self.major == other.major and self.minor == other.minor
+        if not isinstance(other, Version):
+            return NotImplemented
+        return (self.major, self.minor) == (other.major, other.minor)
     
     def __lt__(self, other):
-        if self.major != other.major:
-            return self.major < other.major
-        return self.minor < other.minor
+        if not isinstance(other, Version):
+            return NotImplemented
+        return (self.major, self.minor) < (other.major, other.minor)
+    
+    def __hash__(self):
+        return hash((self.major, self.minor))
 
 v1 = Version(1, 5)
 v2 = Version(2, 0)
 print(f"v1 < v2: {v1 < v2}")
 print(f"v1 == v2: {v1 == v2}")
+print(f"v1 >= v2: {v1 >= v2}")
 
 # Example 3: Container methods
 class TodoList:
+    __slots__ = ("items", "_item_set", "_unhashable")
+    
     def __init__(self):
         self.items = []
+        # Hashable items are mirrored in a set for O(1) membership tests;
+        # unhashable ones (e.g. dicts) can only be found by a scan
+        self._item_set = set()
+        self._unhashable = []
     
     def __len__(self):
         return len(self.items)
@@ -50,10 +71,19 @@ class TodoList:
         return self.items[index]
     
     def __contains__(self, item):
-        return item in self.items
+        try:
+            if item in self._item_set:
+                return True
+        except TypeError:
+            pass
+        return item in self._unhashable
     
     def add(self, item):
         self.items.append(item)
+        try:
+            self._item_set.add(item)
+        except TypeError:
+            self._unhashable.append(item)
 
 todos = TodoList()
 todos.add("Buy milk")
@@ -64,14 +94,14 @@ print(f"Contains 'Write code': {'Write code' in todos}")
 
 # Example 4: Context manager
 class Timer:
+    __slots__ = ("start",)
+    
     def __enter__(self):
-        import time
-        self.start = time.time()
+        self.start = perf_counter()
         return self
     
     def __exit__(self, *args):
-        import time
-        elapsed = time.time() - self.start
+        elapsed = perf_counter() - self.start
         print(f"Elapsed: {elapsed:.2f}s")
 
 with Timer():
@@ -5,26 +5,21 @@ Common patterns in Python.
 
 # Example 1: Singleton
 class DatabaseConnection:
-    _instance = None
-    
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        # The instance is created once at import time, so there is no
+        # check-then-create race between threads
+        return _SINGLETON
+
+_SINGLETON = object.__new__(DatabaseConnection)
+
+def get_db():
+    return _SINGLETON
 
 db1 = DatabaseConnection()
-db2 = DatabaseConnection()
+db2 = get_db()
 print(f"Singleton - same instance: {db1 is db2}")
 
 # Example 2: Factory
-class AnimalFactory:
-    @staticmethod
-    def create(animal_type):
-        if animal_type == "dog":
-            return Dog()
-        elif animal_type == "cat":
-            return Cat()
-
 class Dog:
     def speak(self):
         return "Woof!"
@@ -33,20 +28,50 @@ class Cat:
     def speak(self):
         return "Meow!"
 
+class AnimalFactory:
+    _REGISTRY = {"dog": Dog, "cat": Cat}
+    
+    @classmethod
+    def register(cls, animal_type, animal_class):
+        cls._REGISTRY[animal_type] = animal_class
+    
+    @classmethod
+    def create(cls, animal_type):
+        try:
+            animal_class = cls._REGISTRY[animal_type]
+        except KeyError:
+            raise ValueError(f"Unknown animal type: {animal_type}") from None
+        return animal_class()
+
 dog = AnimalFactory.create("dog")
 print(f"Factory - dog says: {dog.speak()}")
 
+class Duck:
+    def speak(self):
+        return "Quack!"
+
+AnimalFactory.register("duck", Duck)
+print(f"Factory - duck says: {AnimalFactory.create('duck').speak()}")
+
 # Example 3: Observer
 class NewsAgency:
     def __init__(self):
         self.subscribers = []
+        # Bound update methods, kept in step with subscribers
+        self._update_callbacks = []
     
     def subscribe(self, subscriber):
         self.subscribers.append(subscriber)
+        self._update_callbacks.append(subscriber.update)
+    
+    def unsubscribe(self, subscriber):
+        index = self.subscribers.index(subscriber)
+        del self.subscribers[index]
+        del self._update_callbacks[index]
     
     def publish(self, news):
-        for sub in self.subscribers:
-            sub.update(news)
+        for callback in self._update_callbacks:
+            callback(news)
 
 class Subscriber:
     def __init__(self, name):
@@ -61,6 +86,8 @@ sub2 = Subscriber("Bob")
 agency.subscribe(sub1)
 agency.subscribe(sub2)
 agency.publish("Breaking news!")
+agency.unsubscribe(sub1)
+agency.publish("Follow-up story")
 
 # Example 4: Strategy
 class SortStrategy:
@@ -77,10 +104,15 @@ class QuickSort(SortStrategy):
 
 class Sorter:
     def __init__(self, strategy):
-        self.strategy = strategy
+        self.set_strategy(strategy)
     
-    def sort(self, data):
-        return self.strategy.sort(data)
+    def set_strategy(self, strategy):
+        # Bind the strategy's method directly so sorter.sort(data)
+        # calls it without an extra wrapper frame
+        self.strategy = strategy
+        self.sort = strategy.sort
 
 sorter = Sorter(BubbleSort())
 print(f"Strategy - sorted: {sorter.sort([3, 1, 2])}")
+sorter.set_strategy(QuickSort())
+print(f"Strategy - swapped: {sorter.sort([5, 4, 6])}")
@@ -8,6 +8,8 @@ from abc import ABC, abstractmethod
 # Example 1: Single Responsibility Principle
 class User:
     """Only handles user data."""
+    __slots__ = ("name", "email")
+    
     def __init__(self, name, email):
         self.name = name
         self.email = email
@@ -49,6 +51,8 @@ service.notify("Hello!")
 
 # Example 3: Proper encapsulation
 class BankAccount:
+    __slots__ = ("_balance",)
+    
     def __init__(self, balance):
         self._balance = balance  # Protected
     
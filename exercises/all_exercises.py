@@ -5,8 +5,16 @@ Covers all sections: 100-900
 Run individual exercises or all at once.
 """
 
+import math
 import sys
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+
+_PI = math.pi
+_SQRT = math.sqrt
+_LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
 
 
 # ============================================================================
@@ -23,6 +31,7 @@ print("\n--- Exercise 1: Dog Class ---")
 class Dog:
     """Simple Dog class with basic methods."""
     
+    __slots__ = ("name", "age", "breed")
     species = "Canis familiaris"
     
     def __init__(self, name, age, breed):
@@ -57,6 +66,8 @@ print("\n--- Exercise 2: Bank Account ---")
 class BankAccount:
     """Bank account with deposits and withdrawals."""
     
+    __slots__ = ("account_holder", "_balance")
+    
     def __init__(self, account_holder, initial_balance=0):
         self.account_holder = account_holder
         self._balance = initial_balance
@@ -92,6 +103,8 @@ print("\n--- Exercise 3: Rectangle ---")
 class Rectangle:
     """Rectangle with area and perimeter calculations."""
     
+    __slots__ = ("width", "height")
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -198,12 +211,10 @@ class Circle(Shape):
         self.radius = radius
     
     def area(self):
-        import math
-        return math.pi * self.radius ** 2
+        return _PI * self.radius * self.radius
     
     def perimeter(self):
-        import math
-        return 2 * math.pi * self.radius
+        return 2.0 * _PI * self.radius
 
 
 class Rectangle(Shape):
@@ -231,8 +242,7 @@ class Triangle(Shape):
     def area(self):
         # Heron's formula
         s = (self.a + self.b + self.c) / 2
-        import math
-        return math.sqrt(s * (s - self.a) * (s - self.b) * (s - self.c))
+        return _SQRT(s * (s - self.a) * (s - self.b) * (s - self.c))
     
     def perimeter(self):
         return self.a + self.b + self.c
@@ -270,26 +280,28 @@ class Logger:
     """Singleton logger implementation."""
     
     _instance = None
+    MAX_LOGS = 1000
+    min_level = _LOG_LEVELS["INFO"]
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
+            # Set up state here, once; with no __init__ there is nothing
+            # to re-run (or guard against) on later Logger() calls
+            instance = super().__new__(cls)
+            instance.logs = deque(maxlen=cls.MAX_LOGS)  # Oldest entries drop off
+            cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        if self._initialized:
-            return
-        self._initialized = True
-        self.logs = []
-    
     def log(self, message, level="INFO"):
-        entry = f"[{level}] {message}"
-        self.logs.append(entry)
-        print(entry)
+        # Filtered messages are dropped before anything is formatted;
+        # unknown levels are always kept
+        if _LOG_LEVELS.get(level, self.min_level) < self.min_level:
+            return
+        self.logs.append((level, message))
+        sys.stdout.write(f"[{level}] {message}\n")
     
     def get_logs(self):
-        return self.logs.copy()
+        return list(self.logs)
 
 
 # Test
@@ -310,20 +322,25 @@ print("\n--- Exercise 7: Observer Pattern ---")
 class Subject:
     """Observable subject."""
     
+    __slots__ = ("_observers", "_state")
+    
     def __init__(self):
-        self._observers = []
+        # Observer -> weak reference to its bound update method. Weak keys
+        # give O(1) attach/detach, keep attach order, and let observers be
+        # garbage collected without detaching first.
+        self._observers = weakref.WeakKeyDictionary()
         self._state = None
     
     def attach(self, observer):
         if observer not in self._observers:
-            self._observers.append(observer)
+            self._observers[observer] = weakref.WeakMethod(observer.update)
     
     def detach(self, observer):
-        self._observers.remove(observer)
+        self._observers.pop(observer, None)
     
     def notify(self):
-        for observer in self._observers:
-            observer.update(self)
+        for update_ref in self._observers.values():
+            update_ref()(self)
     
     def set_state(self, state):
         self._state = state
@@ -336,6 +353,8 @@ class Subject:
 class Observer(ABC):
     """Abstract observer."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def update(self, subject):
         pass
@@ -344,6 +363,8 @@ class Observer(ABC):
 class ConcreteObserver(Observer):
     """Concrete observer implementation."""
     
+    __slots__ = ("name", "__weakref__")  # Subjects hold observers weakly
+    
     def __init__(self, name):
         self.name = name
     
@@ -369,21 +390,31 @@ print("\n--- Exercise 8: File Manager Context Manager ---")
 class FileManager:
     """Context manager for file operations."""
     
-    def __init__(self, filename, mode='r'):
+    def __init__(self, filename, mode='r', verbose=True):
         self.filename = filename
         self.mode = mode
+        self.verbose = verbose  # Announce open/close on stdout
         self.file = None
     
     def __enter__(self):
-        print(f"Opening {self.filename} in mode '{self.mode}'")
+        if self.verbose:
+            print(f"Opening {self.filename} in mode '{self.mode}'")
         self.file = open(self.filename, self.mode)
         return self.file
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.file:
-            print(f"Closing {self.filename}")
+            if self.verbose:
+                print(f"Closing {self.filename}")
             self.file.close()
         return False  # Don't suppress exceptions
+    
+    def read_all(self):
+        """Read the whole file without entering the context manager."""
+        # Path reads until EOF and, in text mode, applies open()'s default
+        # encoding and newline handling
+        path = Path(self.filename)
+        return path.read_bytes() if 'b' in self.mode else path.read_text()
 
 
 # Test (create temp file first)
@@ -394,6 +425,8 @@ with FileManager('/tmp/test.txt', 'r') as f:
     content = f.read()
     print(f"Content: {content}")
 
+print(f"read_all(): {FileManager('/tmp/test.txt', verbose=False).read_all()}")
+
 
 # Exercise 9: Magic Methods
 print("\n--- Exercise 9: Vector with Magic Methods ---")
@@ -401,6 +434,8 @@ print("\n--- Exercise 9: Vector with Magic Methods ---")
 class Vector:
     """2D Vector with operator overloading."""
     
+    __slots__ = ("x", "y")
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -424,8 +459,7 @@ class Vector:
         return f"Vector(x={self.x}, y={self.y})"
     
     def magnitude(self):
-        import math
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+        return math.hypot(self.x, self.y)
 
 
 # Test
@@ -451,6 +485,8 @@ print("\n--- Exercise 10: SOLID Principles ---")
 # Single Responsibility Principle
 class User:
     """User data only."""
+    __slots__ = ("name", "email")
+    
     def __init__(self, name, email):
         self.name = name
         self.email = email
@@ -11,14 +11,19 @@ This example shows:
 - Singleton pattern for database connection
 """
 
-from typing import List, Optional, Dict, Any
+import re
+from typing import List, Optional, Dict, Any, Set, Sequence, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI, HTTPException, Depends, status
-from pydantic import BaseModel, EmailStr, Field, validator
+from fastapi import FastAPI, HTTPException, Depends, Response, status
+from pydantic import (
+    BaseModel, EmailStr, Field, TypeAdapter, field_validator, model_validator
+)
 
 
 # ============================================================================
@@ -40,6 +45,37 @@ class CloudPlatform(str, Enum):
     GCP = "gcp"
 
 
+# Certification code prefix for each platform, e.g. "AZ-104" for Azure
+_PLATFORM_PREFIXES: Dict[CloudPlatform, str] = {
+    CloudPlatform.AZURE: "AZ-",
+    CloudPlatform.AWS: "AWS-",
+    CloudPlatform.GCP: "GCP-"
+}
+
+
+# Cheap shape check run before EmailStr's full parse
+_EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+
+
+def _precheck_email(value: Any) -> Any:
+    """Reject strings that cannot be an email before EmailStr parses them."""
+    if isinstance(value, str) and not _EMAIL_RE.match(value):
+        raise ValueError('invalid email address')
+    return value
+
+
+def _rate_level_error(
+    level: CertificationLevel,
+    hourly_rate: float
+) -> Optional[str]:
+    """Explain why an hourly rate does not fit a level, or return None."""
+    if level == CertificationLevel.JUNIOR and hourly_rate > 100:
+        return 'Junior rate should not exceed €100/hour'
+    if level == CertificationLevel.SENIOR and hourly_rate < 100:
+        return 'Senior rate should be at least €100/hour'
+    return None
+
+
 # Pydantic models for request/response validation
 class EngineerBase(BaseModel):
     """Base schema for engineer data."""
@@ -49,15 +85,16 @@ class EngineerBase(BaseModel):
     hourly_rate: float = Field(..., gt=0, le=500)
     certification_level: CertificationLevel
     
-    @validator('hourly_rate')
-    def validate_rate(cls, v, values):
+    _check_email = field_validator('email', mode='before')(_precheck_email)
+    
+    @model_validator(mode='after')
+    def validate_rate(self):
         """Ensure hourly rate aligns with certification level."""
-        level = values.get('certification_level')
-        if level == CertificationLevel.JUNIOR and v > 100:
-            raise ValueError('Junior rate should not exceed €100/hour')
-        elif level == CertificationLevel.SENIOR and v < 100:
-            raise ValueError('Senior rate should be at least €100/hour')
-        return v
+        # Runs once on the finished model, when both fields are available
+        error = _rate_level_error(self.certification_level, self.hourly_rate)
+        if error:
+            raise ValueError(error)
+        return self
 
 
 class EngineerCreate(EngineerBase):
@@ -73,6 +110,8 @@ class EngineerUpdate(BaseModel):
     hourly_rate: Optional[float] = Field(None, gt=0, le=500)
     certification_level: Optional[CertificationLevel] = None
     is_available: Optional[bool] = None
+    
+    _check_email = field_validator('email', mode='before')(_precheck_email)
 
 
 class EngineerResponse(EngineerBase):
@@ -93,38 +132,58 @@ class CertificationCreate(BaseModel):
 
 
 # Domain entity (business logic)
+@dataclass(eq=False, slots=True)
 class Engineer:
     """
     Domain entity representing a cloud engineer.
     Contains business logic separate from data validation.
-    """
     
-    def __init__(
-        self,
-        id: int,
-        name: str,
-        email: str,
-        specialty: str,
-        hourly_rate: float,
-        certification_level: CertificationLevel,
-        certifications: Optional[List[str]] = None,
-        is_available: bool = True,
-        created_at: Optional[datetime] = None
-    ):
-        self.id = id
-        self.name = name
-        self.email = email
-        self.specialty = specialty
-        self.hourly_rate = hourly_rate
-        self.certification_level = certification_level
-        self.certifications = certifications or []
-        self.is_available = is_available
-        self.created_at = created_at or datetime.now()
+    Declared as a dataclass so its fields are known to serializers, which
+    lets endpoints return it directly instead of building a dict first.
+    Slots keep the many instances a repository holds compact.
+    """
+    id: int
+    name: str
+    email: str
+    specialty: str
+    hourly_rate: float
+    certification_level: CertificationLevel
+    # Stored as a tuple: it can only change by reassignment, never in place
+    certifications: Optional[Sequence[str]] = None
+    is_available: bool = True
+    created_at: Optional[datetime] = None
+    # Derived from certifications for O(1) checks; not serialized. They are
+    # rebuilt whenever certifications is no longer the tuple they came from
+    _cert_set: Set[str] = field(init=False, repr=False)
+    _platforms: Set[CloudPlatform] = field(init=False, repr=False)
+    _derived_from: Optional[Tuple[str, ...]] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.certifications = tuple(self.certifications or ())
+        self.created_at = self.created_at or datetime.now()
+        self._derived_from = None
+        self._sync_certifications()
+    
+    def _sync_certifications(self) -> Tuple[str, ...]:
+        """Rebuild the lookup sets if certifications was replaced."""
+        certifications = self.certifications
+        if certifications is not self._derived_from:
+            certifications = tuple(certifications or ())
+            self.certifications = certifications
+            self._cert_set = set(certifications)
+            self._platforms = {
+                platform
+                for platform, prefix in _PLATFORM_PREFIXES.items()
+                if any(cert.startswith(prefix) for cert in certifications)
+            }
+            self._derived_from = certifications
+        return certifications
     
     def add_certification(self, cert_code: str) -> None:
         """Add a certification if not already present."""
-        if cert_code not in self.certifications:
-            self.certifications.append(cert_code)
+        certifications = self._sync_certifications()
+        if cert_code not in self._cert_set:
+            self.certifications = certifications + (cert_code,)
     
     def calculate_monthly_revenue(self, hours_per_month: int = 160) -> float:
         """Calculate potential monthly revenue."""
@@ -132,13 +191,8 @@ class Engineer:
     
     def can_work_on_platform(self, platform: CloudPlatform) -> bool:
         """Check if engineer has certifications for a platform."""
-        platform_prefixes = {
-            CloudPlatform.AZURE: "AZ-",
-            CloudPlatform.AWS: "AWS-",
-            CloudPlatform.GCP: "GCP-"
-        }
-        prefix = platform_prefixes.get(platform, "")
-        return any(cert.startswith(prefix) for cert in self.certifications)
+        self._sync_certifications()
+        return platform in self._platforms
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -149,7 +203,7 @@ class Engineer:
             "specialty": self.specialty,
             "hourly_rate": self.hourly_rate,
             "certification_level": self.certification_level.value,
-            "certifications": self.certifications,
+            "certifications": list(self.certifications),
             "is_available": self.is_available,
             "created_at": self.created_at.isoformat()
         }
@@ -181,6 +235,14 @@ class ValidationError(Exception):
 class IEngineerRepository(ABC):
     """Abstract interface for engineer data access."""
     
+    @property
+    def version(self) -> Optional[int]:
+        """
+        Counter that changes on every write, used to invalidate caches.
+        None means the repository does not track writes.
+        """
+        return None
+    
     @abstractmethod
     async def create(self, engineer: Engineer) -> Engineer:
         """Create a new engineer."""
@@ -215,6 +277,14 @@ class IEngineerRepository(ABC):
     async def find_available(self) -> List[Engineer]:
         """Find all available engineers."""
         pass
+    
+    @abstractmethod
+    async def find_available_for_platform(
+        self,
+        platform: CloudPlatform
+    ) -> List[Engineer]:
+        """Find available engineers certified for a platform."""
+        pass
 
 
 class InMemoryEngineerRepository(IEngineerRepository):
@@ -225,19 +295,96 @@ class InMemoryEngineerRepository(IEngineerRepository):
     
     def __init__(self):
         self._engineers: Dict[int, Engineer] = {}
+        # Secondary index for O(1) email lookups and duplicate checks, plus
+        # the indexed email per id so a changed email can be re-keyed
+        self._by_email: Dict[str, int] = {}
+        self._email_by_id: Dict[int, str] = {}
+        # Id sets for the availability and platform queries, refreshed
+        # whenever an engineer is created or updated
+        self._available_ids: Set[int] = set()
+        self._ids_by_platform: Dict[CloudPlatform, Set[int]] = {
+            platform: set() for platform in CloudPlatform
+        }
         self._next_id: int = 1
+        self._version: int = 0
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped on every create, update and delete."""
+        return self._version
+    
+    def clear(self) -> None:
+        """Remove all engineers and restart id numbering."""
+        self._engineers.clear()
+        self._by_email.clear()
+        self._email_by_id.clear()
+        self._available_ids.clear()
+        for ids in self._ids_by_platform.values():
+            ids.clear()
+        self._next_id = 1
+        # Bumped, not reset, so caches built before the clear are invalidated
+        self._version += 1
+    
+    def _index(self, engineer: Engineer) -> None:
+        """Refresh the availability and platform indexes for an engineer."""
+        engineer_id = engineer.id
+        if engineer.is_available:
+            self._available_ids.add(engineer_id)
+        else:
+            self._available_ids.discard(engineer_id)
+        for platform, ids in self._ids_by_platform.items():
+            if engineer.can_work_on_platform(platform):
+                ids.add(engineer_id)
+            else:
+                ids.discard(engineer_id)
+    
+    def _unindex(self, engineer_id: int) -> None:
+        """Remove an engineer from the availability and platform indexes."""
+        self._available_ids.discard(engineer_id)
+        for ids in self._ids_by_platform.values():
+            ids.discard(engineer_id)
+    
+    def _engineers_by_ids(self, ids: Set[int]) -> List[Engineer]:
+        """Resolve ids to engineers in creation (id) order."""
+        return [self._engineers[engineer_id] for engineer_id in sorted(ids)]
+    
+    def _lookup_email(self, email: str) -> Optional[Engineer]:
+        """Find an engineer through the email index."""
+        return self._engineers.get(self._by_email.get(email))
     
     async def create(self, engineer: Engineer) -> Engineer:
         """Create a new engineer."""
         # Check for duplicate email
-        existing = await self.get_by_email(engineer.email)
-        if existing:
+        if self._lookup_email(engineer.email) is not None:
             raise EngineerAlreadyExistsError(f"Engineer with email {engineer.email} already exists")
         
+        self._insert(engineer)
+        self._version += 1
+        return engineer
+    
+    def _insert(self, engineer: Engineer) -> None:
+        """Assign the next id and store an engineer in every index."""
         engineer.id = self._next_id
         self._engineers[self._next_id] = engineer
+        self._by_email[engineer.email] = self._next_id
+        self._email_by_id[self._next_id] = engineer.email
+        self._index(engineer)
         self._next_id += 1
-        return engineer
+    
+    def bulk_load(self, engineers: List[Engineer]) -> int:
+        """
+        Store many engineers in one synchronous pass, e.g. to seed data.
+        Engineers whose email is already stored are skipped.
+        Returns the number of engineers added.
+        """
+        added = 0
+        for engineer in engineers:
+            if self._lookup_email(engineer.email) is None:
+                self._insert(engineer)
+                added += 1
+        if added:
+            self._version += 1
+        return added
     
     async def get_by_id(self, engineer_id: int) -> Optional[Engineer]:
         """Retrieve engineer by ID."""
@@ -245,10 +392,7 @@ class InMemoryEngineerRepository(IEngineerRepository):
     
     async def get_by_email(self, email: str) -> Optional[Engineer]:
         """Retrieve engineer by email."""
-        for engineer in self._engineers.values():
-            if engineer.email == email:
-                return engineer
-        return None
+        return self._lookup_email(email)
     
     async def get_all(self) -> List[Engineer]:
         """Retrieve all engineers."""
@@ -258,19 +402,46 @@ class InMemoryEngineerRepository(IEngineerRepository):
         """Update an existing engineer."""
         if engineer.id not in self._engineers:
             raise EngineerNotFoundError(f"Engineer {engineer.id} not found")
+        owner = self._by_email.get(engineer.email)
+        if owner is not None and owner != engineer.id:
+            raise EngineerAlreadyExistsError(f"Engineer with email {engineer.email} already exists")
         self._engineers[engineer.id] = engineer
+        # Emails are changed in place before update() is called, so the old
+        # key is found through the id
+        old_email = self._email_by_id.get(engineer.id)
+        if old_email != engineer.email:
+            if self._by_email.get(old_email) == engineer.id:
+                del self._by_email[old_email]
+            self._by_email[engineer.email] = engineer.id
+            self._email_by_id[engineer.id] = engineer.email
+        self._index(engineer)
+        self._version += 1
         return engineer
     
     async def delete(self, engineer_id: int) -> bool:
         """Delete an engineer."""
-        if engineer_id in self._engineers:
-            del self._engineers[engineer_id]
-            return True
-        return False
+        engineer = self._engineers.pop(engineer_id, None)
+        if engineer is None:
+            return False
+        email = self._email_by_id.pop(engineer_id)
+        if self._by_email.get(email) == engineer_id:
+            del self._by_email[email]
+        self._unindex(engineer_id)
+        self._version += 1
+        return True
     
     async def find_available(self) -> List[Engineer]:
         """Find all available engineers."""
-        return [eng for eng in self._engineers.values() if eng.is_available]
+        return self._engineers_by_ids(self._available_ids)
+    
+    async def find_available_for_platform(
+        self,
+        platform: CloudPlatform
+    ) -> List[Engineer]:
+        """Find available engineers certified for a platform."""
+        return self._engineers_by_ids(
+            self._available_ids & self._ids_by_platform[platform]
+        )
 
 
 # ============================================================================
@@ -283,18 +454,20 @@ class RepositoryManager:
     Ensures single instance of repositories across the application.
     """
     _instance = None
-    _engineer_repository: Optional[IEngineerRepository] = None
+    _engineer_repository: IEngineerRepository
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            # Repositories are created together with the singleton, so the
+            # property below never has to check for them
+            instance = super().__new__(cls)
+            instance._engineer_repository = InMemoryEngineerRepository()
+            cls._instance = instance
         return cls._instance
     
     @property
     def engineer_repository(self) -> IEngineerRepository:
         """Get the engineer repository instance."""
-        if self._engineer_repository is None:
-            self._engineer_repository = InMemoryEngineerRepository()
         return self._engineer_repository
 
 
@@ -310,6 +483,9 @@ class EngineerService:
     
     def __init__(self, repository: IEngineerRepository):
         self.repository = repository
+        # Last revenue report and the repository version it was built from
+        self._report: Optional[Dict[str, Any]] = None
+        self._report_version: Optional[int] = None
     
     async def create_engineer(self, engineer_data: EngineerCreate) -> Engineer:
         """Create a new engineer with validation."""
@@ -339,18 +515,39 @@ class EngineerService:
         """Update engineer with partial data."""
         engineer = await self.get_engineer(engineer_id)
         
-        # Update only provided fields
-        update_dict = update_data.dict(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(engineer, field, value)
+        # Update only provided fields. None is skipped: no engineer field
+        # is nullable, so an explicit null leaves the stored value alone
+        changes = update_data.model_dump(exclude_unset=True, exclude_none=True)
+        
+        # A partial update can pair a new rate with the stored level (or the
+        # other way round), so the rule is checked on the merged values
+        error = _rate_level_error(
+            changes.get("certification_level", engineer.certification_level),
+            changes.get("hourly_rate", engineer.hourly_rate)
+        )
+        if error:
+            raise ValidationError(error)
+        
+        # Checked before anything is written, as the stored engineer is
+        # changed in place
+        email = changes.get("email")
+        if email is not None and email != engineer.email:
+            other = await self.repository.get_by_email(email)
+            if other is not None and other.id != engineer.id:
+                raise EngineerAlreadyExistsError(f"Engineer with email {email} already exists")
+        
+        for name, value in changes.items():
+            setattr(engineer, name, value)
         
         return await self.repository.update(engineer)
     
     async def delete_engineer(self, engineer_id: int) -> bool:
         """Delete an engineer."""
-        # Verify exists first
-        await self.get_engineer(engineer_id)
-        return await self.repository.delete(engineer_id)
+        # The repository reports whether anything was deleted, so a
+        # separate existence check up front is not needed
+        if not await self.repository.delete(engineer_id):
+            raise EngineerNotFoundError(f"Engineer {engineer_id} not found")
+        return True
     
     async def add_certification(
         self,
@@ -367,38 +564,51 @@ class EngineerService:
         platform: CloudPlatform
     ) -> List[Engineer]:
         """Find available engineers certified for a platform."""
-        all_engineers = await self.repository.get_all()
-        return [
-            eng for eng in all_engineers
-            if eng.is_available and eng.can_work_on_platform(platform)
-        ]
+        return await self.repository.find_available_for_platform(platform)
     
     async def get_revenue_report(self) -> Dict[str, Any]:
-        """Generate revenue potential report."""
-        engineers = await self.repository.get_all()
+        """Generate revenue potential report, reusing it until data changes."""
+        version = self.repository.version
+        if version is not None and version == self._report_version:
+            return self._copy_report(self._report)
         
-        total_monthly = sum(
-            eng.calculate_monthly_revenue()
-            for eng in engineers
-            if eng.is_available
-        )
+        engineers = await self.repository.get_all()
         
-        by_level = {}
-        for level in CertificationLevel:
-            level_engineers = [
-                eng for eng in engineers
-                if eng.certification_level == level and eng.is_available
-            ]
-            by_level[level.value] = {
-                "count": len(level_engineers),
-                "monthly_revenue": sum(eng.calculate_monthly_revenue() for eng in level_engineers)
-            }
+        # One pass over the engineers fills every total at once
+        by_level = {
+            level.value: {"count": 0, "monthly_revenue": 0}
+            for level in CertificationLevel
+        }
+        total_available = 0
+        total_monthly = 0
+        for eng in engineers:
+            if not eng.is_available:
+                continue
+            revenue = eng.calculate_monthly_revenue()
+            level_totals = by_level[eng.certification_level.value]
+            level_totals["count"] += 1
+            level_totals["monthly_revenue"] += revenue
+            total_available += 1
+            total_monthly += revenue
         
-        return {
-            "total_available_engineers": len([e for e in engineers if e.is_available]),
+        self._report = {
+            "total_available_engineers": total_available,
             "total_monthly_revenue_potential": total_monthly,
             "by_certification_level": by_level
         }
+        self._report_version = version
+        return self._copy_report(self._report)
+    
+    @staticmethod
+    def _copy_report(report: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a report so callers cannot change the cached one."""
+        return {
+            **report,
+            "by_certification_level": {
+                level: dict(totals)
+                for level, totals in report["by_certification_level"].items()
+            }
+        }
 
 
 # ============================================================================
@@ -406,22 +616,29 @@ class EngineerService:
 # ============================================================================
 
 def get_repository_manager() -> RepositoryManager:
-    """Dependency for repository manager."""
+    """Get the repository manager singleton."""
     return RepositoryManager()
 
 
-def get_engineer_repository(
-    manager: RepositoryManager = Depends(get_repository_manager)
-) -> IEngineerRepository:
-    """Dependency for engineer repository."""
-    return manager.engineer_repository
+def get_engineer_repository() -> IEngineerRepository:
+    """Get the shared engineer repository."""
+    return get_repository_manager().engineer_repository
 
 
-def get_engineer_service(
-    repository: IEngineerRepository = Depends(get_engineer_repository)
-) -> EngineerService:
-    """Dependency for engineer service."""
-    return EngineerService(repository)
+@lru_cache(maxsize=1)
+def _build_engineer_service() -> EngineerService:
+    """Build the engineer service once; its repository is a singleton."""
+    return EngineerService(get_engineer_repository())
+
+
+async def get_engineer_service() -> EngineerService:
+    """
+    Dependency for engineer service.
+    
+    Has no sub-dependencies for FastAPI to solve per request, and being
+    async it runs on the event loop instead of the threadpool.
+    """
+    return _build_engineer_service()
 
 
 # ============================================================================
@@ -469,11 +686,8 @@ async def lifespan(app: FastAPI):
         )
     ]
     
-    for engineer in sample_engineers:
-        try:
-            await repo.create(engineer)
-        except EngineerAlreadyExistsError:
-            pass  # Already exists from previous run
+    # Engineers that already exist from a previous run are skipped
+    repo.bulk_load(sample_engineers)
     
     print("✓ Application started with sample data")
     
@@ -495,10 +709,27 @@ app = FastAPI(
 # API ENDPOINTS
 # ============================================================================
 
+# Engineers held by the repository were validated on the way in, so
+# endpoints serialize them straight to JSON bytes instead of re-validating
+# through response_model. The models are still listed under `responses`
+# so the OpenAPI docs keep the schema.
+_engineer_json = TypeAdapter(Engineer).dump_json
+_engineer_list_json = TypeAdapter(List[Engineer]).dump_json
+
+
+def _json_response(content: bytes, status_code: int = 200) -> Response:
+    """Wrap pre-serialized JSON bytes in a response."""
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
 @app.post(
     "/engineers",
-    response_model=EngineerResponse,
     status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": EngineerResponse}},
     tags=["Engineers"]
 )
 async def create_engineer(
@@ -508,14 +739,17 @@ async def create_engineer(
     """Create a new cloud engineer."""
     try:
         engineer = await service.create_engineer(engineer_data)
-        return engineer.to_dict()
+        return _json_response(
+            _engineer_json(engineer),
+            status_code=status.HTTP_201_CREATED
+        )
     except EngineerAlreadyExistsError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
 
 @app.get(
     "/engineers",
-    response_model=List[EngineerResponse],
+    responses={200: {"model": List[EngineerResponse]}},
     tags=["Engineers"]
 )
 async def list_engineers(
@@ -528,12 +762,12 @@ async def list_engineers(
     else:
         engineers = await service.repository.get_all()
     
-    return [eng.to_dict() for eng in engineers]
+    return _json_response(_engineer_list_json(engineers))
 
 
 @app.get(
     "/engineers/{engineer_id}",
-    response_model=EngineerResponse,
+    responses={200: {"model": EngineerResponse}},
     tags=["Engineers"]
 )
 async def get_engineer(
@@ -543,14 +777,14 @@ async def get_engineer(
     """Get a specific engineer by ID."""
     try:
         engineer = await service.get_engineer(engineer_id)
-        return engineer.to_dict()
+        return _json_response(_engineer_json(engineer))
     except EngineerNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @app.patch(
     "/engineers/{engineer_id}",
-    response_model=EngineerResponse,
+    responses={200: {"model": EngineerResponse}},
     tags=["Engineers"]
 )
 async def update_engineer(
@@ -561,9 +795,13 @@ async def update_engineer(
     """Update an engineer's information."""
     try:
         engineer = await service.update_engineer(engineer_id, update_data)
-        return engineer.to_dict()
+        return _json_response(_engineer_json(engineer))
     except EngineerNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except EngineerAlreadyExistsError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
 
 @app.delete(
@@ -584,7 +822,7 @@ async def delete_engineer(
 
 @app.post(
     "/engineers/{engineer_id}/certifications",
-    response_model=EngineerResponse,
+    responses={200: {"model": EngineerResponse}},
     tags=["Certifications"]
 )
 async def add_certification(
@@ -595,14 +833,14 @@ async def add_certification(
     """Add a certification to an engineer."""
     try:
         engineer = await service.add_certification(engineer_id, cert_data)
-        return engineer.to_dict()
+        return _json_response(_engineer_json(engineer))
     except EngineerNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
 @app.get(
     "/engineers/platform/{platform}",
-    response_model=List[EngineerResponse],
+    responses={200: {"model": List[EngineerResponse]}},
     tags=["Engineers"]
 )
 async def find_engineers_by_platform(
@@ -611,7 +849,7 @@ async def find_engineers_by_platform(
 ):
     """Find available engineers certified for a specific platform."""
     engineers = await service.find_engineers_for_platform(platform)
-    return [eng.to_dict() for eng in engineers]
+    return _json_response(_engineer_list_json(engineers))
 
 
 @app.get(
@@ -2,16 +2,17 @@
 Unit and Integration Tests for FastAPI OOP Example
 
 Demonstrates:
-- Unit testing service layer with mocked repositories
+- Unit testing service layer with a fake repository
 - Integration testing API endpoints
 - Testing validation logic
 - Testing business logic in domain models
 """
 
+import asyncio
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
-from typing import List
+from uuid import uuid4
+from typing import List, Optional
 
 from fastapi.testclient import TestClient
 from fastapi_oop_example import (
@@ -22,6 +23,7 @@ from fastapi_oop_example import (
     InMemoryEngineerRepository,
     EngineerNotFoundError,
     EngineerAlreadyExistsError,
+    ValidationError,
     CertificationLevel,
     CloudPlatform,
     EngineerCreate,
@@ -30,6 +32,114 @@ from fastapi_oop_example import (
 )
 
 
+# ============================================================================
+# TEST DATA BUILDERS
+# ============================================================================
+
+# Defaults shared by every test engineer, built once at import
+_ENGINEER_DEFAULTS = {
+    "id": 0,
+    "name": "Test",
+    "email": "test@example.com",
+    "specialty": "Cloud",
+    "hourly_rate": 100,
+    "certification_level": CertificationLevel.MID,
+}
+
+
+def _make_engineer(**overrides) -> Engineer:
+    """Build an Engineer from the shared defaults plus per-test overrides."""
+    return Engineer(**{**_ENGINEER_DEFAULTS, **overrides})
+
+
+_BASE_CREATED_AT = datetime(2026, 2, 7, 10, 0, 0)
+
+# Request payloads validated once at import; tests only read them
+SAMPLE_ENGINEER_CREATE = EngineerCreate(
+    name="Test",
+    email="test@example.com",
+    specialty="Cloud",
+    hourly_rate=100,
+    certification_level=CertificationLevel.MID
+)
+SAMPLE_ENGINEER_UPDATE = EngineerUpdate(hourly_rate=120)
+
+
+@pytest.fixture(scope="module")
+def base_engineer():
+    """Canonical engineer shared by read-only tests; do not mutate."""
+    return _make_engineer(id=1, created_at=_BASE_CREATED_AT)
+
+
+@pytest.fixture(scope="module")
+def shared_repo():
+    """One repository instance reused by the repository tests."""
+    return InMemoryEngineerRepository()
+
+
+@pytest.fixture
+def repo(shared_repo):
+    """Empty repository for one test, cleared again afterwards."""
+    yield shared_repo
+    shared_repo.clear()
+
+
+class FakeEngineerRepository(IEngineerRepository):
+    """
+    Hand-rolled repository double for service tests.
+    Returns canned values and records each call as (method, argument).
+    """
+    
+    def __init__(self):
+        self.create_return: Optional[Engineer] = None
+        self.get_by_id_return: Optional[Engineer] = None
+        self.update_return: Optional[Engineer] = None
+        self.calls: List[tuple] = []
+    
+    async def create(self, engineer):
+        self.calls.append(("create", engineer))
+        return self.create_return
+    
+    async def get_by_id(self, engineer_id):
+        self.calls.append(("get_by_id", engineer_id))
+        return self.get_by_id_return
+    
+    async def get_by_email(self, email):
+        self.calls.append(("get_by_email", email))
+        return None
+    
+    async def get_all(self):
+        self.calls.append(("get_all", None))
+        return []
+    
+    async def update(self, engineer):
+        self.calls.append(("update", engineer))
+        return self.update_return
+    
+    async def delete(self, engineer_id):
+        self.calls.append(("delete", engineer_id))
+        return False
+    
+    async def find_available(self):
+        self.calls.append(("find_available", None))
+        return []
+    
+    async def find_available_for_platform(self, platform):
+        self.calls.append(("find_available_for_platform", platform))
+        return []
+    
+    def call_names(self) -> List[str]:
+        """Names of the methods called so far, in order."""
+        return [name for name, _ in self.calls]
+
+
+@pytest.fixture
+def fake_repo_service():
+    """Fresh fake repository and the service wrapping it."""
+    fake_repo = FakeEngineerRepository()
+    return fake_repo, EngineerService(fake_repo)
+
+
 # ============================================================================
 # DOMAIN MODEL TESTS
 # ============================================================================
@@ -37,32 +147,16 @@ from fastapi_oop_example import (
 class TestEngineerDomainModel:
     """Test the Engineer domain entity business logic."""
     
-    def test_engineer_initialization(self):
+    def test_engineer_initialization(self, base_engineer):
         """Test engineer object creation."""
-        engineer = Engineer(
-            id=1,
-            name="Test Engineer",
-            email="test@example.com",
-            specialty="Testing",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
-        
-        assert engineer.id == 1
-        assert engineer.name == "Test Engineer"
-        assert engineer.certifications == []
-        assert engineer.is_available is True
+        assert base_engineer.id == 1
+        assert base_engineer.name == "Test"
+        assert base_engineer.certifications == ()
+        assert base_engineer.is_available is True
     
     def test_add_certification(self):
         """Test adding certifications to an engineer."""
-        engineer = Engineer(
-            id=1,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
+        engineer = _make_engineer(id=1)
         
         engineer.add_certification("AZ-104")
         assert "AZ-104" in engineer.certifications
@@ -71,58 +165,54 @@ class TestEngineerDomainModel:
         engineer.add_certification("AZ-104")
         assert engineer.certifications.count("AZ-104") == 1
     
-    def test_calculate_monthly_revenue(self):
-        """Test revenue calculation."""
-        engineer = Engineer(
-            id=1,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
+    def test_replaced_certifications_are_picked_up(self):
+        """Test the platform lookup follows a reassigned certification list."""
+        engineer = _make_engineer(id=1, certifications=["AZ-104"])
+        
+        with pytest.raises(AttributeError):
+            engineer.certifications.append("GCP-PCA")
         
-        # Default 160 hours
-        assert engineer.calculate_monthly_revenue() == 16000
+        engineer.certifications = ["AZ-104", "GCP-PCA"]
+        assert engineer.can_work_on_platform(CloudPlatform.GCP) is True
         
-        # Custom hours
-        assert engineer.calculate_monthly_revenue(140) == 14000
+        engineer.add_certification("GCP-PCA")
+        assert engineer.certifications == ("AZ-104", "GCP-PCA")
+    
+    @pytest.mark.parametrize(
+        "args,expected",
+        [((), 16000), ((140,), 14000)],
+        ids=["default-160h", "custom-140h"]
+    )
+    def test_calculate_monthly_revenue(self, base_engineer, args, expected):
+        """Test revenue calculation."""
+        assert base_engineer.calculate_monthly_revenue(*args) == expected
     
-    def test_can_work_on_platform(self):
+    @pytest.mark.parametrize(
+        "platform,expected",
+        [
+            (CloudPlatform.AZURE, True),
+            (CloudPlatform.AWS, True),
+            (CloudPlatform.GCP, False),
+        ],
+        ids=["azure", "aws", "gcp"]
+    )
+    def test_can_work_on_platform(self, platform, expected):
         """Test platform certification checking."""
-        engineer = Engineer(
+        engineer = _make_engineer(
             id=1,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID,
             certifications=["AZ-104", "AZ-700", "AWS-SAA"]
         )
         
-        assert engineer.can_work_on_platform(CloudPlatform.AZURE) is True
-        assert engineer.can_work_on_platform(CloudPlatform.AWS) is True
-        assert engineer.can_work_on_platform(CloudPlatform.GCP) is False
+        assert engineer.can_work_on_platform(platform) is expected
     
-    def test_to_dict(self):
+    def test_to_dict(self, base_engineer):
         """Test dictionary serialization."""
-        created_at = datetime(2026, 2, 7, 10, 0, 0)
-        engineer = Engineer(
-            id=1,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID,
-            created_at=created_at
-        )
-        
-        result = engineer.to_dict()
+        result = base_engineer.to_dict()
         
         assert result["id"] == 1
         assert result["name"] == "Test"
         assert result["certification_level"] == "mid"
-        assert result["created_at"] == created_at.isoformat()
+        assert result["created_at"] == _BASE_CREATED_AT.isoformat()
 
 
 # ============================================================================
@@ -133,17 +223,9 @@ class TestInMemoryEngineerRepository:
     """Test the in-memory repository implementation."""
     
     @pytest.mark.asyncio
-    async def test_create_engineer(self):
+    async def test_create_engineer(self, repo):
         """Test creating an engineer."""
-        repo = InMemoryEngineerRepository()
-        engineer = Engineer(
-            id=0,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
+        engineer = _make_engineer()
         
         result = await repo.create(engineer)
         
@@ -151,45 +233,19 @@ class TestInMemoryEngineerRepository:
         assert result.name == "Test"
     
     @pytest.mark.asyncio
-    async def test_create_duplicate_email(self):
+    async def test_create_duplicate_email(self, repo):
         """Test creating engineer with duplicate email raises error."""
-        repo = InMemoryEngineerRepository()
-        
-        engineer1 = Engineer(
-            id=0,
-            name="Test1",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
-        await repo.create(engineer1)
-        
-        engineer2 = Engineer(
-            id=0,
-            name="Test2",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
+        await repo.create(_make_engineer(name="Test1"))
+        
+        engineer2 = _make_engineer(name="Test2")
         
         with pytest.raises(EngineerAlreadyExistsError):
             await repo.create(engineer2)
     
     @pytest.mark.asyncio
-    async def test_get_by_id(self):
+    async def test_get_by_id(self, repo):
         """Test retrieving engineer by ID."""
-        repo = InMemoryEngineerRepository()
-        engineer = Engineer(
-            id=0,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
-        created = await repo.create(engineer)
+        created = await repo.create(_make_engineer())
         
         result = await repo.get_by_id(created.id)
         
@@ -198,27 +254,16 @@ class TestInMemoryEngineerRepository:
         assert result.email == "test@example.com"
     
     @pytest.mark.asyncio
-    async def test_get_by_id_not_found(self):
+    async def test_get_by_id_not_found(self, repo):
         """Test retrieving non-existent engineer returns None."""
-        repo = InMemoryEngineerRepository()
-        
         result = await repo.get_by_id(999)
         
         assert result is None
     
     @pytest.mark.asyncio
-    async def test_get_by_email(self):
+    async def test_get_by_email(self, repo):
         """Test retrieving engineer by email."""
-        repo = InMemoryEngineerRepository()
-        engineer = Engineer(
-            id=0,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
-        await repo.create(engineer)
+        await repo.create(_make_engineer())
         
         result = await repo.get_by_email("test@example.com")
         
@@ -226,38 +271,34 @@ class TestInMemoryEngineerRepository:
         assert result.email == "test@example.com"
     
     @pytest.mark.asyncio
-    async def test_get_all(self):
+    async def test_get_by_email_after_email_change(self, repo):
+        """Test the email index follows an email changed through update."""
+        created = await repo.create(_make_engineer())
+        
+        created.email = "renamed@example.com"
+        await repo.update(created)
+        
+        assert await repo.get_by_email("test@example.com") is None
+        assert await repo.get_by_email("renamed@example.com") is created
+    
+    @pytest.mark.asyncio
+    async def test_get_all(self, repo):
         """Test retrieving all engineers."""
-        repo = InMemoryEngineerRepository()
-        
-        for i in range(3):
-            engineer = Engineer(
-                id=0,
-                name=f"Test{i}",
-                email=f"test{i}@example.com",
-                specialty="Cloud",
-                hourly_rate=100,
-                certification_level=CertificationLevel.MID
+        await asyncio.gather(*(
+            repo.create(
+                _make_engineer(name=f"Test{i}", email=f"test{i}@example.com")
             )
-            await repo.create(engineer)
+            for i in range(3)
+        ))
         
         result = await repo.get_all()
         
         assert len(result) == 3
     
     @pytest.mark.asyncio
-    async def test_update_engineer(self):
+    async def test_update_engineer(self, repo):
         """Test updating an engineer."""
-        repo = InMemoryEngineerRepository()
-        engineer = Engineer(
-            id=0,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
-        created = await repo.create(engineer)
+        created = await repo.create(_make_engineer())
         
         created.hourly_rate = 120
         result = await repo.update(created)
@@ -265,34 +306,17 @@ class TestInMemoryEngineerRepository:
         assert result.hourly_rate == 120
     
     @pytest.mark.asyncio
-    async def test_update_nonexistent_engineer(self):
+    async def test_update_nonexistent_engineer(self, repo):
         """Test updating non-existent engineer raises error."""
-        repo = InMemoryEngineerRepository()
-        engineer = Engineer(
-            id=999,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
+        engineer = _make_engineer(id=999)
         
         with pytest.raises(EngineerNotFoundError):
             await repo.update(engineer)
     
     @pytest.mark.asyncio
-    async def test_delete_engineer(self):
+    async def test_delete_engineer(self, repo):
         """Test deleting an engineer."""
-        repo = InMemoryEngineerRepository()
-        engineer = Engineer(
-            id=0,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
-        created = await repo.create(engineer)
+        created = await repo.create(_make_engineer())
         
         result = await repo.delete(created.id)
         
@@ -300,140 +324,227 @@ class TestInMemoryEngineerRepository:
         assert await repo.get_by_id(created.id) is None
     
     @pytest.mark.asyncio
-    async def test_find_available(self):
+    async def test_find_available(self, repo):
         """Test finding available engineers."""
-        repo = InMemoryEngineerRepository()
-        
         # Create available engineer
-        eng1 = Engineer(
-            id=0,
+        await repo.create(_make_engineer(
             name="Available",
             email="available@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID,
             is_available=True
-        )
-        await repo.create(eng1)
+        ))
         
         # Create unavailable engineer
-        eng2 = Engineer(
-            id=0,
+        await repo.create(_make_engineer(
             name="Busy",
             email="busy@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID,
             is_available=False
-        )
-        await repo.create(eng2)
+        ))
         
         result = await repo.find_available()
         
         assert len(result) == 1
         assert result[0].is_available is True
+    
+    @pytest.mark.asyncio
+    async def test_update_to_taken_email(self, repo):
+        """Test update refuses an email owned by another engineer."""
+        await repo.create(_make_engineer(email="a@example.com"))
+        other = await repo.create(_make_engineer(email="b@example.com"))
+        
+        other.email = "a@example.com"
+        with pytest.raises(EngineerAlreadyExistsError):
+            await repo.update(other)
+        
+        # The index still belongs to the first engineer
+        with pytest.raises(EngineerAlreadyExistsError):
+            await repo.create(_make_engineer(email="a@example.com"))
+    
+    @pytest.mark.asyncio
+    async def test_find_available_after_update(self, repo):
+        """Test availability changes saved through update are picked up."""
+        busy = await repo.create(_make_engineer(is_available=False))
+        assert await repo.find_available() == []
+        
+        busy.is_available = True
+        await repo.update(busy)
+        assert await repo.find_available() == [busy]
+        
+        await repo.delete(busy.id)
+        assert await repo.find_available() == []
+    
+    @pytest.mark.asyncio
+    async def test_find_available_for_platform(self, repo):
+        """Test the platform index follows certifications and deletes."""
+        engineer = await repo.create(_make_engineer(certifications=["AZ-104"]))
+        assert await repo.find_available_for_platform(CloudPlatform.AZURE) == [
+            engineer
+        ]
+        assert await repo.find_available_for_platform(CloudPlatform.GCP) == []
+        
+        engineer.add_certification("GCP-PCA")
+        await repo.update(engineer)
+        assert await repo.find_available_for_platform(CloudPlatform.GCP) == [
+            engineer
+        ]
+        
+        await repo.delete(engineer.id)
+        for platform in CloudPlatform:
+            assert await repo.find_available_for_platform(platform) == []
+    
+    @pytest.mark.asyncio
+    async def test_bulk_load_skips_existing_emails(self, repo):
+        """Test bulk_load adds new engineers and skips known emails."""
+        existing = await repo.create(_make_engineer(email="a@example.com"))
+        
+        added = repo.bulk_load([
+            _make_engineer(name="Duplicate", email="a@example.com"),
+            _make_engineer(name="New", email="b@example.com"),
+        ])
+        
+        assert added == 1
+        assert await repo.get_by_email("a@example.com") is existing
+        assert [e.name for e in await repo.get_all()] == ["Test", "New"]
 
 
 # ============================================================================
-# SERVICE LAYER TESTS (with mocked repository)
+# SERVICE LAYER TESTS (with a fake repository)
 # ============================================================================
 
 class TestEngineerService:
-    """Test the service layer with mocked dependencies."""
+    """Test the service layer against a fake repository."""
     
     @pytest.mark.asyncio
-    async def test_create_engineer(self):
+    async def test_create_engineer(self, fake_repo_service, base_engineer):
         """Test creating engineer through service."""
-        # Mock repository
-        mock_repo = AsyncMock(spec=IEngineerRepository)
-        mock_repo.create.return_value = Engineer(
-            id=1,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
+        fake_repo, service = fake_repo_service
+        fake_repo.create_return = base_engineer
         
-        service = EngineerService(mock_repo)
-        engineer_data = EngineerCreate(
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
-        
-        result = await service.create_engineer(engineer_data)
+        result = await service.create_engineer(SAMPLE_ENGINEER_CREATE)
         
         assert result.id == 1
         assert result.name == "Test"
-        mock_repo.create.assert_called_once()
+        assert fake_repo.call_names() == ["create"]
     
     @pytest.mark.asyncio
-    async def test_get_engineer(self):
+    async def test_get_engineer(self, fake_repo_service, base_engineer):
         """Test getting engineer through service."""
-        mock_repo = AsyncMock(spec=IEngineerRepository)
-        mock_repo.get_by_id.return_value = Engineer(
-            id=1,
-            name="Test",
-            email="test@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
-        )
+        fake_repo, service = fake_repo_service
+        fake_repo.get_by_id_return = base_engineer
         
-        service = EngineerService(mock_repo)
         result = await service.get_engineer(1)
         
         assert result.id == 1
-        mock_repo.get_by_id.assert_called_once_with(1)
+        assert fake_repo.calls == [("get_by_id", 1)]
     
     @pytest.mark.asyncio
-    async def test_get_engineer_not_found(self):
+    async def test_get_engineer_not_found(self, fake_repo_service):
         """Test getting non-existent engineer raises error."""
-        mock_repo = AsyncMock(spec=IEngineerRepository)
-        mock_repo.get_by_id.return_value = None
-        
-        service = EngineerService(mock_repo)
+        fake_repo, service = fake_repo_service
+        fake_repo.get_by_id_return = None
         
         with pytest.raises(EngineerNotFoundError):
             await service.get_engineer(999)
     
     @pytest.mark.asyncio
-    async def test_update_engineer(self):
+    async def test_update_engineer(self, fake_repo_service):
         """Test updating engineer through service."""
-        existing_engineer = Engineer(
+        # The service mutates this engineer, so it gets its own instance
+        existing_engineer = _make_engineer(
             id=1,
             name="Original",
-            email="original@example.com",
-            specialty="Cloud",
-            hourly_rate=100,
-            certification_level=CertificationLevel.MID
+            email="original@example.com"
         )
         
-        mock_repo = AsyncMock(spec=IEngineerRepository)
-        mock_repo.get_by_id.return_value = existing_engineer
-        mock_repo.update.return_value = existing_engineer
-        
-        service = EngineerService(mock_repo)
-        update_data = EngineerUpdate(hourly_rate=120)
+        fake_repo, service = fake_repo_service
+        fake_repo.get_by_id_return = existing_engineer
+        fake_repo.update_return = existing_engineer
         
-        result = await service.update_engineer(1, update_data)
+        result = await service.update_engineer(1, SAMPLE_ENGINEER_UPDATE)
         
         assert result.hourly_rate == 120
         assert result.name == "Original"  # Unchanged
-        mock_repo.update.assert_called_once()
+        assert fake_repo.call_names().count("update") == 1
+    
+    @pytest.mark.asyncio
+    async def test_update_engineer_rate_level_mismatch(self, fake_repo_service):
+        """Test a partial update is checked against the stored values."""
+        existing_engineer = _make_engineer(id=1, hourly_rate=120)
+        
+        fake_repo, service = fake_repo_service
+        fake_repo.get_by_id_return = existing_engineer
+        
+        update = EngineerUpdate(certification_level=CertificationLevel.JUNIOR)
+        with pytest.raises(ValidationError):
+            await service.update_engineer(1, update)
+        
+        assert existing_engineer.certification_level == CertificationLevel.MID
+        assert "update" not in fake_repo.call_names()
+    
+    @pytest.mark.asyncio
+    async def test_update_engineer_ignores_nulls(self, fake_repo_service):
+        """Test explicit nulls leave the stored fields unchanged."""
+        existing_engineer = _make_engineer(id=1, name="Original")
+        
+        fake_repo, service = fake_repo_service
+        fake_repo.get_by_id_return = existing_engineer
+        fake_repo.update_return = existing_engineer
+        
+        update = EngineerUpdate(name=None, email=None, hourly_rate=120)
+        result = await service.update_engineer(1, update)
+        
+        assert result.name == "Original"
+        assert result.email == "test@example.com"
+        assert result.hourly_rate == 120
+    
+    @pytest.mark.asyncio
+    async def test_revenue_report(self, repo):
+        """Test the single-pass revenue totals and their invalidation."""
+        service = EngineerService(repo)
+        await repo.create(_make_engineer(email="a@example.com", hourly_rate=100))
+        await repo.create(_make_engineer(
+            email="b@example.com",
+            hourly_rate=150,
+            certification_level=CertificationLevel.SENIOR
+        ))
+        busy = await repo.create(_make_engineer(
+            email="c@example.com",
+            is_available=False
+        ))
+        
+        report = await service.get_revenue_report()
+        
+        assert report["total_available_engineers"] == 2
+        assert report["total_monthly_revenue_potential"] == 40000
+        assert report["by_certification_level"]["mid"] == {
+            "count": 1, "monthly_revenue": 16000
+        }
+        assert report["by_certification_level"]["junior"]["count"] == 0
+        
+        # Changing a returned report does not touch the cached one
+        report["total_available_engineers"] = -1
+        report["by_certification_level"]["mid"]["count"] = -1
+        cached = await service.get_revenue_report()
+        assert cached["total_available_engineers"] == 2
+        assert cached["by_certification_level"]["mid"]["count"] == 1
+        
+        # A write through the repository invalidates the cached report
+        busy.is_available = True
+        await repo.update(busy)
+        report = await service.get_revenue_report()
+        
+        assert report["total_available_engineers"] == 3
+        assert report["by_certification_level"]["mid"]["count"] == 2
 
 
 # ============================================================================
 # API INTEGRATION TESTS
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create test client."""
-    return TestClient(app)
+    """Test client shared by the API tests; lifespan runs once."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 class TestEngineerAPI:
@@ -448,9 +559,11 @@ class TestEngineerAPI:
     
     def test_create_engineer(self, client):
         """Test creating engineer via API."""
+        # The app's repository outlives the client, so use a fresh email
+        email = f"apitest-{uuid4().hex}@example.com"
         engineer_data = {
             "name": "API Test Engineer",
-            "email": "apitest@example.com",
+            "email": email,
             "specialty": "Testing",
             "hourly_rate": 105,
             "certification_level": "mid"
@@ -461,14 +574,19 @@ class TestEngineerAPI:
         assert response.status_code == 201
         data = response.json()
         assert data["name"] == "API Test Engineer"
-        assert data["email"] == "apitest@example.com"
+        assert data["email"] == email
         assert "id" in data
     
-    def test_create_engineer_validation_error(self, client):
+    @pytest.mark.parametrize(
+        "email",
+        ["invalid-email", "a@", "@b.com", "a@b", "x" * 300 + "@y.com"],
+        ids=["no-at", "no-domain", "no-local", "no-tld", "too-long"],
+    )
+    def test_create_engineer_validation_error(self, client, email):
         """Test validation errors on create."""
         invalid_data = {
             "name": "Test",
-            "email": "invalid-email",  # Invalid email
+            "email": email,
             "specialty": "Testing",
             "hourly_rate": 100,
             "certification_level": "mid"
@@ -477,6 +595,72 @@ class TestEngineerAPI:
         response = client.post("/engineers", json=invalid_data)
         
         assert response.status_code == 422  # Validation error
+        assert any(
+            "email" in error["loc"] for error in response.json()["detail"]
+        )
+    
+    def test_create_engineer_rate_level_mismatch(self, client):
+        """Test a junior above €100/hour is rejected on create."""
+        engineer_data = {
+            "name": "Test",
+            "email": f"apitest-{uuid4().hex}@example.com",
+            "specialty": "Testing",
+            "hourly_rate": 300,
+            "certification_level": "junior"
+        }
+        
+        response = client.post("/engineers", json=engineer_data)
+        
+        assert response.status_code == 422
+    
+    def test_update_engineer_rate_level_mismatch(self, client):
+        """Test a PATCH breaking the rate rule is rejected and not stored."""
+        created = client.post("/engineers", json={
+            "name": "Test",
+            "email": f"apitest-{uuid4().hex}@example.com",
+            "specialty": "Testing",
+            "hourly_rate": 105,
+            "certification_level": "mid"
+        }).json()
+        url = f"/engineers/{created['id']}"
+        
+        response = client.patch(url, json={"certification_level": "junior"})
+        
+        assert response.status_code == 422
+        data = client.get(url).json()
+        assert data["certification_level"] == "mid"
+        assert data["hourly_rate"] == 105
+    
+    def test_update_engineer_to_taken_email(self, client):
+        """Test a PATCH to another engineer's email is rejected with 409."""
+        emails = [f"apitest-{uuid4().hex}@example.com" for _ in range(3)]
+        ids = [
+            client.post("/engineers", json={
+                "name": "Test",
+                "email": email,
+                "specialty": "Testing",
+                "hourly_rate": 105,
+                "certification_level": "mid"
+            }).json()["id"]
+            for email in emails[:2]
+        ]
+        url = f"/engineers/{ids[1]}"
+        
+        response = client.patch(url, json={"email": emails[0]})
+        assert response.status_code == 409
+        assert client.get(url).json()["email"] == emails[1]
+        
+        # Moving on to a free email must not release the first one
+        response = client.patch(url, json={"email": emails[2]})
+        assert response.status_code == 200
+        response = client.post("/engineers", json={
+            "name": "Test",
+            "email": emails[0],
+            "specialty": "Testing",
+            "hourly_rate": 105,
+            "certification_level": "mid"
+        })
+        assert response.status_code == 409
     
     def test_get_engineer(self, client):
         """Test getting specific engineer."""